@@ -1,3 +1,4 @@
+import re
 from typing import Any, Dict, List, Optional
 
 from ..utils.config import GLOBAL_CONFIG
@@ -122,6 +123,13 @@ class CustomRule(AlertRule):
         super().__init__(config.get("name", "Custom Rule"), enabled=config.get("enabled", True))
         self.config = config
         self.severity = AlertSeverity(config.get("severity", "warning"))
+        # Compiled once per rule instead of on every evaluation; None when the pattern is not a valid regex
+        self._module_regex: Optional[re.Pattern] = None
+        if config.get("module_pattern"):
+            try:
+                self._module_regex = re.compile(config["module_pattern"])
+            except re.error:
+                pass
 
     def evaluate(
         self,
@@ -142,11 +150,8 @@ class CustomRule(AlertRule):
         module_pattern = self.config.get("module_pattern")
 
         if module_pattern and module_scores:
-            import re
-
-            try:
-                pattern = re.compile(module_pattern)
-            except re.error:
+            pattern = self._module_regex
+            if pattern is None:
                 return None
 
             for module_name, scores_data in module_scores.items():
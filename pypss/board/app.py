@@ -1,28 +1,136 @@
+import bisect
+import copy
+import functools
+import html
 import os
+import sys
 import time
-from datetime import datetime
-from typing import Any, Callable, Dict, List, Optional
+from typing import Any, Callable, Dict, List, Optional, Set, Tuple
 
+import numpy as np
 import pandas as pd
-from nicegui import app, ui
+from nicegui import app, background_tasks, run, ui
 
 from pypss.board.charts import (
     create_custom_chart,
-    create_gauge_chart,
-    create_historical_chart,
     create_trend_chart,
+    figure_data,
+    gauge_chart_data,
+    historical_chart_data,
     plot_concurrency_dist,
     plot_entropy_heatmap,
     plot_error_heatmap,
     plot_stability_trends,
 )
-from pypss.board.data_loader import TraceProcessor, load_trace_data
-from pypss.core import compute_pss_from_traces
+from pypss.board.data_loader import (
+    FAILED_ROW_FORMATTERS,
+    TraceProcessor,
+    load_trace_data,
+    table_page,
+    trace_fingerprint,
+)
+from pypss.board.header import get_header_state
+from pypss.board.watcher import get_trace_watcher
 from pypss.storage import get_storage_backend
 from pypss.utils.config import GLOBAL_CONFIG
 
 _WIDGET_REGISTRY: Dict[str, Callable] = {}
 
+# (layout list, its widgets grouped by tab); regrouped only when the settings replace the layout list
+_tab_layouts: Tuple[Optional[List[Dict[str, Any]]], Dict[Any, List[Dict[str, Any]]]] = (None, {})
+
+
+def tab_layout(tab_name: str) -> List[Dict[str, Any]]:
+    """Widget configs of the dashboard layout that belong to `tab_name`, in layout order."""
+    global _tab_layouts
+    layout = GLOBAL_CONFIG.dashboard_layout
+    if _tab_layouts[0] is not layout:
+        grouped: Dict[Any, List[Dict[str, Any]]] = {}
+        for widget_config in layout:
+            grouped.setdefault(widget_config.get("tab"), []).append(widget_config)
+        _tab_layouts = (layout, grouped)
+    return _tab_layouts[1].get(tab_name, [])
+
+
+# Tailwind class strings shared by the dashboard cards, defined once instead of per element
+CARD_CLASSES = "shadow-sm border border-gray-200 bg-white p-0 flex flex-col"
+CARD_HEADER_CLASSES = "w-full p-4 border-b border-gray-200 items-center justify-between"
+CARD_TITLE_CLASSES = "font-bold text-gray-700 text-lg"
+CARD_ICON_CLASSES = "text-gray-400"
+
+# Column schema of the failed-trace tables (shared, never mutated)
+FAILED_TRACE_COLUMNS = [
+    {"name": "time", "label": "Time", "field": "time", "sortable": True, "align": "left"},
+    {"name": "module", "label": "Module", "field": "module", "sortable": True, "align": "left"},
+    {"name": "function", "label": "Function", "field": "function", "sortable": True, "align": "left"},
+    {"name": "error_type", "label": "Error Type", "field": "error_type", "sortable": True, "align": "left"},
+    {
+        "name": "error_message",
+        "label": "Error Message",
+        "field": "error_message",
+        "sortable": False,
+        "align": "left",
+        "classes": "max-w-xs truncate",
+    },
+    {"name": "duration", "label": "Duration", "field": "duration", "sortable": True, "align": "right"},
+]
+FAILED_TRACE_COLUMNS_NO_MODULE = [c for c in FAILED_TRACE_COLUMNS if c["name"] != "module"]
+
+# AI advisor recommendations for the weakest metric, overall and for the most unstable module
+WORST_METRIC_RECOMMENDATIONS = {
+    "error_volatility": "Focus on identifying and fixing critical errors, especially in modules with high error rates.",
+    "timing_stability": "Investigate latency spikes and variance. Look for I/O bottlenecks or inefficient algorithms.",
+    "memory_stability": "Address potential memory leaks or excessive memory consumption in high-impact modules.",
+    "branching_entropy": "Review complex conditional logic and ensure predictable execution paths.",
+    "concurrency_chaos": "Analyze resource contention and thread/process synchronization issues.",
+}
+MODULE_RECOMMENDATIONS = {
+    "error_volatility": "Specifically, review error handling and logic in the `{module}` module.",
+    "timing_stability": "Deep dive into `{module}` to profile performance bottlenecks.",
+    "memory_stability": "Examine `{module}` for memory allocation patterns and potential leaks.",
+}
+
+
+def _position(items: List[Any], item: Any) -> int:
+    """Index of `item` in `items` by identity (settings rows may compare equal to each other)."""
+    return next(i for i, candidate in enumerate(items) if candidate is item)
+
+
+# Score colouring of the metric breakdown: (text class, bar class) below 0.70, below 0.90, and from 0.90 up
+SCORE_LEVEL_BOUNDS = (0.70, 0.90)
+SCORE_LEVEL_CLASSES = (
+    ("text-red-600", "bg-negative"),
+    ("text-amber-500", "bg-warning"),
+    ("text-green-600", "bg-positive"),
+)
+
+
+@functools.lru_cache(maxsize=64)
+def _metric_label(metric_name: str) -> str:
+    return html.escape(metric_name.replace("_", " ").title())
+
+
+def metric_breakdown_html(breakdown: Dict[str, float]) -> str:
+    """
+    Markup of the metric breakdown list: name, score and a bar coloured like a Quasar progress bar.
+    The list is static, so one HTML element replaces a row, two labels and a progress bar per metric.
+    """
+    rows = []
+    for metric_name, score_value in breakdown.items():
+        score_color_class, bar_color_class = SCORE_LEVEL_CLASSES[bisect.bisect_right(SCORE_LEVEL_BOUNDS, score_value)]
+        label = _metric_label(metric_name)
+        width = min(max(score_value, 0.0), 1.0) * 100
+        rows.append(
+            '<div class="w-full flex items-center justify-between">'
+            f'<span class="text-sm font-medium text-gray-600">{label}</span>'
+            '<div class="flex items-center gap-3">'
+            f'<span class="text-sm font-bold {score_color_class}">{int(score_value * 100)}</span>'
+            '<div class="w-24 h-1 rounded overflow-hidden bg-gray-200">'
+            f'<div class="h-full {bar_color_class}" style="width: {width:.1f}%"></div>'
+            "</div></div></div>"
+        )
+    return f'<div class="w-full flex flex-col gap-3">{"".join(rows)}</div>'
+
 
 def register_widget(widget_type: str):
     def decorator(func):
@@ -32,7 +140,50 @@ def register_widget(widget_type: str):
     return decorator
 
 
-def start_board(trace_file: str):
+def deferred_plotly(builder: Callable[..., Any], *args: Any, classes: str = "w-full"):
+    """
+    Renders a spinner placeholder and builds the Plotly figure in NiceGUI's thread pool.
+    The figure replaces the spinner once ready, so the event loop is never blocked by
+    figure construction or serialization.
+    """
+    container = ui.column().classes("w-full items-center justify-center")
+    with container:
+        ui.spinner(size="lg", color="primary").classes("m-8")
+
+    async def build():
+        try:
+            fig = await run.io_bound(lambda: figure_data(builder(*args)))
+        except Exception as e:
+            if not container.is_deleted:
+                container.clear()
+                with container:
+                    ui.label(f"Error loading chart: {e}").classes("text-red-500 p-4")
+            return
+        if container.is_deleted or fig is None:
+            return
+        container.clear()
+        with container:
+            ui.plotly(fig).classes(classes)
+
+    ui.timer(0, build, once=True)
+    return container
+
+
+# Process-wide caches: the page function runs once per connected client and they all share these.
+# Most recent (data key, figure dict) per chart, reused when a refresh brings no new data
+_figure_cache: Dict[str, Tuple[Any, Any]] = {}
+# Most recent (data key, (analysis, recommendations)) produced by the AI advisor
+_diagnostics_cache: Dict[str, Tuple[Any, Tuple[str, str]]] = {}
+# History backend, reused until the storage settings change
+_storage_cache: Dict[Tuple[str, Optional[str]], Any] = {}
+# (load time, history figure dict) per storage setting; history rows only change when a run is stored,
+# so refreshes and other clients within the TTL reuse the figure instead of querying the backend again
+HISTORY_CACHE_TTL = 5.0
+_history_cache: Dict[Tuple[str, Optional[str]], Tuple[float, Dict[str, Any]]] = {}
+
+
+async def start_board(trace_file: str):
+    """Builds the dashboard page for one client."""
     # --- THEME CONFIGURATION (Google AI Studio inspired) ---
     # Deep primary for dark mode, clean for light mode
     ui.colors(
@@ -45,15 +196,41 @@ def start_board(trace_file: str):
         warning=GLOBAL_CONFIG.ui_theme_warning,
     )
 
-    # Register static files
-    docs_dir = os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "..", "docs"))
-    if os.path.exists(docs_dir):
-        app.add_static_files("/static", docs_dir)
-    else:
-        print(f"Warning: Docs directory not found at {docs_dir}. Static files will not be served.")
-
     # State
-    last_mtime = 0.0
+    header_state = get_header_state()
+    ui.context.client.on_delete(header_state.attach())
+
+    def cached_plotly(name: str, key: Any, builder: Callable[..., Any], *args: Any, classes: str = "w-full"):
+        cached = _figure_cache.get(name)
+        if cached is not None and cached[0] == key:
+            return ui.plotly(cached[1]).classes(classes)
+
+        def build():
+            # Cache the serializable dict so later clients skip the go.Figure conversion too
+            fig = figure_data(builder(*args))
+            _figure_cache[name] = (key, fig)
+            return fig
+
+        return deferred_plotly(build, classes=classes)
+
+    def data_key(report: Dict[str, Any], raw_traces: List[Dict[str, Any]]):
+        return trace_fingerprint(raw_traces), report.get("pss")
+
+    def chart_input(raw_traces: List[Dict[str, Any]], processor: Optional[TraceProcessor]):
+        # Chart builders share the processor's DataFrame instead of each rebuilding one from the dicts
+        return processor.frame if processor is not None else raw_traces
+
+    def history_storage():
+        key = (GLOBAL_CONFIG.storage_backend, GLOBAL_CONFIG.storage_uri)
+        if key not in _storage_cache:
+            _storage_cache.clear()
+            _storage_cache[key] = get_storage_backend(
+                {
+                    "storage_backend": GLOBAL_CONFIG.storage_backend,
+                    "storage_uri": GLOBAL_CONFIG.storage_uri,
+                }
+            )
+        return _storage_cache[key]
 
     # AI Diagnostics Logic
     def generate_ai_diagnostics(report, df):
@@ -75,35 +252,23 @@ def start_board(trace_file: str):
 
         # Find worst performing metric
         breakdown_scores = report["breakdown"]
-        worst_metric = min(breakdown_scores, key=breakdown_scores.get)
-        worst_metric_score = breakdown_scores[worst_metric] * 100  # Convert to 0-100
+        worst_metric, worst_metric_score = min(breakdown_scores.items(), key=lambda item: item[1])
+        worst_metric_score *= 100  # Convert to 0-100
 
         if worst_metric_score < 70:
             analysis_summary.append(
                 f"**{worst_metric.replace('_', ' ').title()}** is the weakest pillar ({worst_metric_score:.1f}/100)."
             )
 
-            if worst_metric == "error_volatility":
-                recommendations.append(
-                    "Focus on identifying and fixing critical errors, especially in modules with high error rates."
-                )
-            elif worst_metric == "timing_stability":
-                recommendations.append(
-                    "Investigate latency spikes and variance. Look for I/O bottlenecks or inefficient algorithms."
-                )
-            elif worst_metric == "memory_stability":
-                recommendations.append(
-                    "Address potential memory leaks or excessive memory consumption in high-impact modules."
-                )
-            elif worst_metric == "branching_entropy":
-                recommendations.append("Review complex conditional logic and ensure predictable execution paths.")
-            elif worst_metric == "concurrency_chaos":
-                recommendations.append("Analyze resource contention and thread/process synchronization issues.")
+            if worst_metric in WORST_METRIC_RECOMMENDATIONS:
+                recommendations.append(WORST_METRIC_RECOMMENDATIONS[worst_metric])
 
         # Find top offending module if overall PSS is not excellent
         top_offender_module = "N/A"
-        if overall_pss < 90 and not df.empty:
-            worst_module_row = df.loc[df["pss"].idxmin()]
+        module_pss = df["pss"].to_numpy(dtype=np.float64) if not df.empty else np.empty(0)
+        # nanargmin skips unscored (NaN) modules, as idxmin did; with no scores there is no offender
+        if overall_pss < 90 and not np.isnan(module_pss).all():
+            worst_module_row = df.iloc[np.nanargmin(module_pss)]
             top_offender_module = worst_module_row["module"]
             offender_pss = worst_module_row["pss"]
             analysis_summary.append(
@@ -111,24 +276,13 @@ def start_board(trace_file: str):
             )
 
             # More specific recommendations based on top offender and worst metric
-            if worst_metric_score < 70 and top_offender_module != "N/A":
-                if worst_metric == "error_volatility":
-                    recommendations.append(
-                        f"Specifically, review error handling and logic in the `{top_offender_module}` module."
-                    )
-                elif worst_metric == "timing_stability":
-                    recommendations.append(
-                        f"Deep dive into `{top_offender_module}` to profile performance bottlenecks."
-                    )
-                elif worst_metric == "memory_stability":
-                    recommendations.append(
-                        f"Examine `{top_offender_module}` for memory allocation patterns and potential leaks."
-                    )
+            if worst_metric_score < 70 and top_offender_module != "N/A" and worst_metric in MODULE_RECOMMENDATIONS:
+                recommendations.append(MODULE_RECOMMENDATIONS[worst_metric].format(module=top_offender_module))
 
         return "\n".join([f"* {s}" for s in analysis_summary]), "\n".join([f"* {r}" for r in recommendations])
 
     # Anomaly Detection Logic
-    def check_for_anomalies(report, raw_traces):
+    def check_for_anomalies(report, kpis):
         CRITICAL_PSS_THRESHOLD = GLOBAL_CONFIG.dashboard_critical_pss_threshold
         WARNING_ERROR_RATE = GLOBAL_CONFIG.dashboard_warning_error_rate
 
@@ -140,10 +294,7 @@ def start_board(trace_file: str):
             is_anomaly = True
             anomaly_messages.append(f"CRITICAL: Overall PSS ({overall_pss}/100) is below {CRITICAL_PSS_THRESHOLD}.")
 
-        # Calculate current error rate
-        error_count = len([t for t in raw_traces if t.get("error")])
-        total_traces = len(raw_traces)
-        current_error_rate = (error_count / total_traces) if total_traces > 0 else 0
+        current_error_rate = kpis["error_rate"]
 
         if current_error_rate > WARNING_ERROR_RATE:
             is_anomaly = True
@@ -154,10 +305,15 @@ def start_board(trace_file: str):
         return is_anomaly, "\n".join(anomaly_messages)
 
     # Module Detail Dialog (moved outside content() for broader access)
-    def show_module_detail_dialog(
-        report: Dict[str, Any], df: pd.DataFrame, raw_traces: List[Dict[str, Any]], module_name: str
+    async def show_module_detail_dialog(
+        report: Dict[str, Any],
+        df: pd.DataFrame,
+        raw_traces: List[Dict[str, Any]],
+        module_name: str,
+        processor: Optional[TraceProcessor] = None,
     ):
-        module_traces = [t for t in raw_traces if t.get("module") == module_name]
+        processor = processor or TraceProcessor(raw_traces)
+        module_traces = processor.get_module_traces(module_name)
         if not module_traces:
             ui.notify(
                 f"No traces found for module {module_name}.",
@@ -165,7 +321,10 @@ def start_board(trace_file: str):
             )
             return
 
-        module_report = compute_pss_from_traces(module_traces)
+        # Scoring a large module is CPU-heavy; keep the event loop free while it runs
+        module_report = await run.io_bound(processor.get_module_report, module_name)
+        if module_report is None:
+            return
 
         with (
             ui.dialog() as dialog,
@@ -178,86 +337,87 @@ def start_board(trace_file: str):
 
             with ui.column().classes("flex-grow overflow-y-auto w-full gap-4 p-4"):
                 # Module-specific Latency Trend
-                with ui.card().classes("w-full shadow-sm border border-gray-200 bg-white p-0 flex flex-col"):
-                    with ui.row().classes("w-full p-4 border-b border-gray-200 items-center justify-between"):
-                        ui.label(f"Latency Percentiles for {module_name}").classes("font-bold text-gray-700 text-lg")
-                        ui.icon("show_chart", size="sm").classes("text-gray-400")
-                    ui.plotly(create_trend_chart(module_traces)).classes("w-full h-64")
+                with ui.card().classes(f"w-full {CARD_CLASSES}"):
+                    with ui.row().classes(CARD_HEADER_CLASSES):
+                        ui.label(f"Latency Percentiles for {module_name}").classes(CARD_TITLE_CLASSES)
+                        ui.icon("show_chart", size="sm").classes(CARD_ICON_CLASSES)
+                    # Sliced from the processor's frame (only on a cache miss) instead of rebuilt from the dicts
+                    cached_plotly(
+                        f"module_trend:{module_name}",
+                        trace_fingerprint(module_traces),
+                        lambda: create_trend_chart(processor.get_module_frame(module_name)),
+                        classes="w-full h-64",
+                    )
 
                 # Module-specific Failed Traces
-                failed_module_traces_all = [t for t in module_traces if t.get("error")]
-
-                if failed_module_traces_all:
-                    rows = []
-                    for t in failed_module_traces_all:
-                        ts_str = datetime.fromtimestamp(t.get("timestamp", 0)).strftime("%H:%M:%S")
-                        rows.append(
-                            {
-                                "time": ts_str,
-                                "function": t.get("name", "unknown"),
-                                "error_type": t.get("exception_type", "N/A"),
-                                "error_message": t.get("exception_message", "N/A"),
-                                "duration": (f"{t.get('duration', 0) * 1000:.1f}ms"),
-                            }
-                        )
+                failed = processor.get_failed_frame(module_name)
 
-                    with ui.card().classes("w-full shadow-sm border border-gray-200 bg-white p-0 flex flex-col mt-4"):
-                        with ui.row().classes("w-full p-4 border-b border-gray-200 items-center justify-between"):
-                            ui.label(f"Failed Traces in {module_name} ({len(failed_module_traces_all)})").classes(
+                if len(failed):
+                    with ui.card().classes(f"w-full {CARD_CLASSES} mt-4"):
+                        with ui.row().classes(CARD_HEADER_CLASSES):
+                            ui.label(f"Failed Traces in {module_name} ({len(failed)})").classes(
                                 "font-bold text-red-600 text-lg"
                             )
                             ui.icon("error_outline", size="sm").classes("text-red-400")
 
-                        ui.table(
-                            columns=[
-                                {
-                                    "name": "time",
-                                    "label": "Time",
-                                    "field": "time",
-                                    "sortable": True,
-                                    "align": "left",
-                                },
-                                {
-                                    "name": "function",
-                                    "label": "Function",
-                                    "field": "function",
-                                    "sortable": True,
-                                    "align": "left",
-                                },
-                                {
-                                    "name": "error_type",
-                                    "label": "Error Type",
-                                    "field": "error_type",
-                                    "sortable": True,
-                                    "align": "left",
-                                },
-                                {
-                                    "name": "error_message",
-                                    "label": "Error Message",
-                                    "field": "error_message",
-                                    "sortable": False,
-                                    "align": "left",
-                                    "classes": "max-w-xs truncate",
-                                },
-                                {
-                                    "name": "duration",
-                                    "label": "Duration",
-                                    "field": "duration",
-                                    "sortable": True,
-                                    "align": "right",
-                                },
-                            ],
-                            rows=rows,
-                            pagination=5,
-                        ).classes("w-full flex-grow")
+                        failed_traces_table(processor, failed, rows_per_page=5, show_module=False)
                 else:
                     ui.label("No failed traces for this module.").classes("text-gray-500 italic mt-4")
 
             dialog.open()
 
-    def show_failures(report: Dict[str, Any], df: pd.DataFrame, raw_traces: List[Dict[str, Any]]):
-        failed_traces = [t for t in raw_traces if t.get("error")]
-        if not failed_traces:
+    def failed_traces_table(
+        processor: TraceProcessor, failed: pd.DataFrame, rows_per_page: int, show_module: bool = True
+    ) -> ui.table:
+        """
+        Paginated, sortable table of failed traces. Pages are sorted and formatted on the server,
+        so only the visible rows are ever sent to the browser.
+        """
+        pagination = {
+            "page": 1,
+            "rowsPerPage": rows_per_page,
+            "sortBy": None,
+            "descending": False,
+            "rowsNumber": len(failed),
+        }
+        table = ui.table(
+            columns=FAILED_TRACE_COLUMNS if show_module else FAILED_TRACE_COLUMNS_NO_MODULE,
+            rows=table_page(failed, pagination, formatters=FAILED_ROW_FORMATTERS),
+            row_key="index",
+            pagination=pagination,
+        ).classes("w-full flex-grow cursor-pointer")
+
+        def load_page(e):
+            page = {**e.args["pagination"], "rowsNumber": len(failed)}
+            table.rows = table_page(failed, page, formatters=FAILED_ROW_FORMATTERS)
+            table.pagination = page
+
+        table.on("request", load_page)
+        table.on("rowClick", lambda e: show_error_message(processor, e.args[1]["index"]))
+        return table
+
+    def show_error_message(processor: TraceProcessor, index: int):
+        cols = processor.columns
+        with ui.dialog() as dialog, ui.card().classes("w-full max-w-3xl"):
+            with ui.row().classes("w-full items-center justify-between border-b pb-2"):
+                ui.label(f"{cols.exception_type[index]} in {cols.name[index]}").classes(
+                    "text-lg font-bold text-red-600"
+                )
+                ui.button(icon="close", on_click=dialog.close).props("flat round dense")
+            ui.label(str(cols.exception_message[index])).classes(
+                "font-mono text-sm whitespace-pre-wrap break-all max-h-[60vh] overflow-y-auto"
+            )
+        dialog.open()
+
+    def show_failures(
+        report: Dict[str, Any],
+        df: pd.DataFrame,
+        raw_traces: List[Dict[str, Any]],
+        processor: Optional[TraceProcessor] = None,
+    ):
+        processor = processor or TraceProcessor(raw_traces)
+        failed = processor.get_failed_frame()
+        if not len(failed):
             ui.notify("No failed traces found.", type="positive")
             return
 
@@ -266,72 +426,10 @@ def start_board(trace_file: str):
             ui.card().classes("w-full max-w-6xl h-[90vh] flex flex-col"),
         ):
             with ui.row().classes("w-full items-center justify-between border-b pb-2"):
-                ui.label(f"All Failed Traces ({len(failed_traces)})").classes("text-xl font-bold text-red-600")
+                ui.label(f"All Failed Traces ({len(failed)})").classes("text-xl font-bold text-red-600")
                 ui.button(icon="close", on_click=dialog.close).props("flat round dense")
 
-            rows = []
-            for t in failed_traces:
-                ts_str = datetime.fromtimestamp(t.get("timestamp", 0)).strftime("%H:%M:%S")
-                rows.append(
-                    {
-                        "time": ts_str,
-                        "module": t.get("module", "unknown"),
-                        "function": t.get("name", "unknown"),
-                        "error_type": t.get("exception_type", "N/A"),
-                        "error_message": t.get("exception_message", "N/A"),
-                        "duration": (f"{t.get('duration', 0) * 1000:.1f}ms"),
-                    }
-                )
-
-            ui.table(
-                columns=[
-                    {
-                        "name": "time",
-                        "label": "Time",
-                        "field": "time",
-                        "sortable": True,
-                        "align": "left",
-                    },
-                    {
-                        "name": "module",
-                        "label": "Module",
-                        "field": "module",
-                        "sortable": True,
-                        "align": "left",
-                    },
-                    {
-                        "name": "function",
-                        "label": "Function",
-                        "field": "function",
-                        "sortable": True,
-                        "align": "left",
-                    },
-                    {
-                        "name": "error_type",
-                        "label": "Error Type",
-                        "field": "error_type",
-                        "sortable": True,
-                        "align": "left",
-                    },
-                    {
-                        "name": "error_message",
-                        "label": "Error Message",
-                        "field": "error_message",
-                        "sortable": False,
-                        "align": "left",
-                        "classes": "max-w-xs truncate",
-                    },
-                    {
-                        "name": "duration",
-                        "label": "Duration",
-                        "field": "duration",
-                        "sortable": True,
-                        "align": "right",
-                    },
-                ],
-                rows=rows,
-                pagination=10,
-            ).classes("w-full flex-grow")
+            failed_traces_table(processor, failed, rows_per_page=10)
 
             dialog.open()
 
@@ -343,13 +441,13 @@ def start_board(trace_file: str):
         processor: TraceProcessor,
     ):
         with ui.grid(columns=12).classes("w-full gap-6"):
-            tab_layout = [w for w in GLOBAL_CONFIG.dashboard_layout if w.get("tab") == tab_name]
+            widgets = tab_layout(tab_name)
 
-            if not tab_layout:
+            if not widgets:
                 ui.label(f"No widgets configured for {tab_name} tab.").classes("text-gray-500 italic")
                 return
 
-            for widget_config in tab_layout:
+            for widget_config in widgets:
                 widget_type = widget_config["type"]
                 if widget_type in _WIDGET_REGISTRY:
                     _WIDGET_REGISTRY[widget_type](
@@ -560,9 +658,8 @@ def start_board(trace_file: str):
         dialog.open()
 
     def show_settings_dialog(current_report=None, current_df=None, current_trace_file=None):
-        from pypss.utils.config import GLOBAL_CONFIG  # Re-import to get latest
-
-        # Local state for dialog inputs using a dictionary
+        # Local state for dialog inputs using a dictionary. Only the dialog's controls write to it, so they are
+        # bound one way (bind_value_to): a two-way binding to a plain dict is polled by NiceGUI for changes.
         settings: Dict[str, Any] = {
             "sample_rate": GLOBAL_CONFIG.sample_rate,
             "max_traces": GLOBAL_CONFIG.max_traces,
@@ -579,10 +676,28 @@ def start_board(trace_file: str):
             "error_spike_threshold": GLOBAL_CONFIG.error_spike_threshold,
             "consecutive_error_threshold": GLOBAL_CONFIG.consecutive_error_threshold,
             "concurrency_wait_threshold": GLOBAL_CONFIG.concurrency_wait_threshold,
-            "dashboard_layout": [dict(w) for w in GLOBAL_CONFIG.dashboard_layout],  # Deep copy
-            "custom_alert_rules": [dict(r) for r in GLOBAL_CONFIG.custom_alert_rules],  # Deep copy
         }
 
+        # Only the Sampling panel is built when the dialog opens; the others are filled the first time their tab
+        # is shown. The layout and alert rule lists are also only copied (deeply: rules hold nested condition
+        # lists) then, so opening and cancelling the dialog copies and renders neither.
+        rendered_panels: Set[str] = set()
+
+        def render_lazy_panel(tab_name):
+            if tab_name in rendered_panels:
+                return
+            rendered_panels.add(tab_name)
+            if tab_name == "weights":
+                render_weights_panel()
+            elif tab_name == "thresholds":
+                render_thresholds_panel()
+            elif tab_name == "layout":
+                settings["dashboard_layout"] = copy.deepcopy(GLOBAL_CONFIG.dashboard_layout)
+                render_layout_list()
+            elif tab_name == "alerts":
+                settings["custom_alert_rules"] = copy.deepcopy(GLOBAL_CONFIG.custom_alert_rules)
+                render_alerts_list()
+
         with (
             ui.dialog() as dialog,
             ui.card().classes("w-full max-w-6xl h-[90vh] p-0 flex flex-col"),
@@ -603,7 +718,9 @@ def start_board(trace_file: str):
                 ui.tab("alerts", label="Alert Rules", icon="notifications_active")
 
             # --- Tab Panels (Main Content) ---
-            with ui.tab_panels(tabs, value="sampling").classes("w-full flex-1 overflow-y-auto"):
+            with ui.tab_panels(tabs, value="sampling", on_change=lambda e: render_lazy_panel(e.value)).classes(
+                "w-full flex-1 overflow-y-auto"
+            ):
                 # --- Sampling Panel ---
                 with ui.tab_panel("sampling"):
                     with ui.column().classes("gap-4 p-4"):
@@ -618,7 +735,7 @@ def start_board(trace_file: str):
                                 max=1.0,
                                 step=0.01,
                                 value=settings["sample_rate"],
-                            ).bind_value(settings, "sample_rate").props("label-always")
+                            ).bind_value_to(settings, "sample_rate").props("label-always")
 
                         ui.separator()
 
@@ -628,115 +745,132 @@ def start_board(trace_file: str):
                                 ui.icon("help_outline", size="xs").tooltip(
                                     "The maximum number of traces to keep in the buffer."
                                 ).classes("text-gray-500 cursor-pointer")
-                            ui.number(value=settings["max_traces"]).bind_value(settings, "max_traces").props(
-                                "outlined dense"
+                            ui.number(value=settings["max_traces"]).bind_value_to(settings, "max_traces").props(
+                                "outlined dense debounce=200"
                             ).classes("w-full")
 
                 # --- Weights Panel ---
                 with ui.tab_panel("weights").classes("w-full p-0"):
-                    with ui.column().classes("gap-4 p-4 items-stretch"):
-                        sum_label = ui.label().classes("font-mono font-bold self-end mb-2 px-2 py-1 rounded-md")
-
-                        def update_sum():
-                            s = (
-                                settings["w_ts"]
-                                + settings["w_ms"]
-                                + settings["w_ev"]
-                                + settings["w_be"]
-                                + settings["w_cc"]
-                            )
-                            sum_label.set_text(f"Sum: {s:.2f}")
-                            if abs(s - 1.0) > 0.001:
-                                sum_label.classes(
-                                    "bg-red-100 text-red-700",
-                                    remove="bg-green-100 text-green-700",
-                                )
-                            else:
-                                sum_label.classes(
-                                    "bg-green-100 text-green-700",
-                                    remove="bg-red-100 text-red-700",
+                    weights_container = ui.column().classes("gap-4 p-4 items-stretch")
+
+                    def render_weights_panel():
+                        with weights_container:
+                            sum_label = ui.label().classes("font-mono font-bold self-end mb-2 px-2 py-1 rounded-md")
+
+                            # Whether the weights currently sum to 1; the label colours only change on a transition
+                            sum_ok: Optional[bool] = None
+
+                            def update_sum():
+                                nonlocal sum_ok
+                                s = (
+                                    settings["w_ts"]
+                                    + settings["w_ms"]
+                                    + settings["w_ev"]
+                                    + settings["w_be"]
+                                    + settings["w_cc"]
                                 )
+                                sum_label.set_text(f"Sum: {s:.2f}")
+                                ok = abs(s - 1.0) <= 0.001
+                                if ok == sum_ok:
+                                    return
+                                sum_ok = ok
+                                if not ok:
+                                    sum_label.classes(
+                                        "bg-red-100 text-red-700",
+                                        remove="bg-green-100 text-green-700",
+                                    )
+                                else:
+                                    sum_label.classes(
+                                        "bg-green-100 text-green-700",
+                                        remove="bg-red-100 text-red-700",
+                                    )
 
-                        def weight_slider(key, label_text):
-                            with ui.column().classes("items-stretch"):
-                                ui.label(label_text).classes("text-md font-semibold")
-                                ui.slider(min=0.0, max=1.0, step=0.01, value=settings[key]).bind_value(
-                                    settings, key
-                                ).props("label-always").classes("w-full").on("update:model-value", lambda: update_sum())
-                            ui.separator()
+                            def weight_slider(key, label_text):
+                                with ui.column().classes("items-stretch"):
+                                    ui.label(label_text).classes("text-md font-semibold")
+                                    # Trailing-edge throttle: the sum is recomputed once a drag settles, not per frame
+                                    ui.slider(min=0.0, max=1.0, step=0.01, value=settings[key]).bind_value_to(
+                                        settings, key
+                                    ).props("label-always").classes("w-full").on(
+                                        "update:model-value", lambda: update_sum(), throttle=0.2, leading_events=False
+                                    )
+                                ui.separator()
 
-                        weight_slider("w_ts", "Timing Stability")
-                        weight_slider("w_ms", "Memory Stability")
-                        weight_slider("w_ev", "Error Volatility")
-                        weight_slider("w_be", "Branching Entropy")
-                        weight_slider("w_cc", "Concurrency Chaos")
+                            weight_slider("w_ts", "Timing Stability")
+                            weight_slider("w_ms", "Memory Stability")
+                            weight_slider("w_ev", "Error Volatility")
+                            weight_slider("w_be", "Branching Entropy")
+                            weight_slider("w_cc", "Concurrency Chaos")
 
-                        update_sum()
+                            update_sum()
 
                 # --- Sensitivity Panel ---
                 with ui.tab_panel("thresholds").classes("w-full p-0"):
-                    with ui.column().classes("gap-4 p-4 items-stretch"):
+                    thresholds_container = ui.column().classes("gap-4 p-4 items-stretch")
 
-                        def threshold_input(key, label_text, tooltip_text, step):
-                            with ui.column().classes("items-stretch"):
-                                with ui.row().classes("items-center"):
-                                    ui.label(label_text).classes("text-md font-semibold")
-                                    ui.icon("help_outline", size="xs").tooltip(tooltip_text).classes(
-                                        "text-gray-500 cursor-pointer"
-                                    )
-                                ui.number(value=settings[key]).bind_value(settings, key).props(
-                                    f"outlined dense step={step}"
-                                ).classes("w-full")
-                            ui.separator()
-
-                        threshold_input(
-                            "alpha",
-                            "Timing CV (alpha)",
-                            "Sensitivity to timing variance. Higher is stricter.",
-                            0.1,
-                        )
-                        threshold_input(
-                            "beta",
-                            "Timing Tail (beta)",
-                            "Sensitivity to latency spikes. Higher is stricter.",
-                            0.1,
-                        )
-                        threshold_input(
-                            "gamma",
-                            "Memory (gamma)",
-                            "Sensitivity to memory usage variance. Higher is stricter.",
-                            0.1,
-                        )
-                        threshold_input(
-                            "mem_spike_threshold_ratio",
-                            "Memory Spike Ratio",
-                            "Ratio to detect a memory spike.",
-                            0.1,
-                        )
-                        threshold_input(
-                            "delta",
-                            "Error (delta)",
-                            "Sensitivity to error bursts. Higher is stricter.",
-                            0.1,
-                        )
-                        threshold_input(
-                            "error_spike_threshold",
-                            "Error Spike Rate",
-                            "Error rate to detect an error spike.",
-                            0.01,
-                        )
-                        threshold_input(
-                            "consecutive_error_threshold",
-                            "Consecutive Errors",
-                            "Number of consecutive errors to detect a spike.",
-                            1,
-                        )
-                        threshold_input(
-                            "concurrency_wait_threshold",
-                            "Concurrency Wait (s)",
-                            "Concurrency wait time threshold in seconds.",
-                            0.0001,
-                        )
+                    def render_thresholds_panel():
+                        with thresholds_container:
+
+                            def threshold_input(key, label_text, tooltip_text, step):
+                                with ui.column().classes("items-stretch"):
+                                    with ui.row().classes("items-center"):
+                                        ui.label(label_text).classes("text-md font-semibold")
+                                        ui.icon("help_outline", size="xs").tooltip(tooltip_text).classes(
+                                            "text-gray-500 cursor-pointer"
+                                        )
+                                    ui.number(value=settings[key]).bind_value_to(settings, key).props(
+                                        f"outlined dense step={step} debounce=200"
+                                    ).classes("w-full")
+                                ui.separator()
+
+                            threshold_input(
+                                "alpha",
+                                "Timing CV (alpha)",
+                                "Sensitivity to timing variance. Higher is stricter.",
+                                0.1,
+                            )
+                            threshold_input(
+                                "beta",
+                                "Timing Tail (beta)",
+                                "Sensitivity to latency spikes. Higher is stricter.",
+                                0.1,
+                            )
+                            threshold_input(
+                                "gamma",
+                                "Memory (gamma)",
+                                "Sensitivity to memory usage variance. Higher is stricter.",
+                                0.1,
+                            )
+                            threshold_input(
+                                "mem_spike_threshold_ratio",
+                                "Memory Spike Ratio",
+                                "Ratio to detect a memory spike.",
+                                0.1,
+                            )
+                            threshold_input(
+                                "delta",
+                                "Error (delta)",
+                                "Sensitivity to error bursts. Higher is stricter.",
+                                0.1,
+                            )
+                            threshold_input(
+                                "error_spike_threshold",
+                                "Error Spike Rate",
+                                "Error rate to detect an error spike.",
+                                0.01,
+                            )
+                            threshold_input(
+                                "consecutive_error_threshold",
+                                "Consecutive Errors",
+                                "Number of consecutive errors to detect a spike.",
+                                1,
+                            )
+                            threshold_input(
+                                "concurrency_wait_threshold",
+                                "Concurrency Wait (s)",
+                                "Concurrency wait time threshold in seconds.",
+                                0.0001,
+                            )
 
                 # --- Layout Builder Panel ---
                 with ui.tab_panel("layout").classes("w-full p-0"):
@@ -744,93 +878,101 @@ def start_board(trace_file: str):
                         ui.label("Dashboard Layout Builder").classes("text-xl font-bold")
 
                         layout_container = ui.column().classes("w-full gap-2")
+                        # One card per layout entry, kept in the same order as settings["dashboard_layout"]
+                        # so edits patch a single card instead of rebuilding the whole list.
+                        layout_rows: List[ui.card] = []
 
-                        def move_item(idx, direction):
+                        def move_item(item, direction):
                             layout = settings["dashboard_layout"]
+                            idx = _position(layout, item)
                             new_idx = idx + direction
                             if 0 <= new_idx < len(layout):
                                 layout[idx], layout[new_idx] = layout[new_idx], layout[idx]
-                                render_layout_list()
+                                layout_rows[idx], layout_rows[new_idx] = layout_rows[new_idx], layout_rows[idx]
+                                layout_rows[new_idx].move(layout_container, target_index=new_idx)
 
-                        def remove_item(idx):
+                        def remove_item(item):
+                            idx = _position(settings["dashboard_layout"], item)
                             del settings["dashboard_layout"][idx]
-                            render_layout_list()
+                            layout_rows.pop(idx).delete()
 
                         def add_widget():
-                            settings["dashboard_layout"].append(
-                                {
-                                    "type": "custom_chart",
-                                    "col_span": 6,
-                                    "tab": "overview",
-                                    "title": "New Chart",
-                                    "x_axis": "timestamp",
-                                    "y_axis": "duration",
-                                    "chart_type": "line",
-                                }
-                            )
-                            render_layout_list()
+                            item = {
+                                "type": "custom_chart",
+                                "col_span": 6,
+                                "tab": "overview",
+                                "title": "New Chart",
+                                "x_axis": "timestamp",
+                                "y_axis": "duration",
+                                "chart_type": "line",
+                            }
+                            settings["dashboard_layout"].append(item)
+                            with layout_container:
+                                layout_rows.append(build_layout_row(item))
+
+                        def build_layout_row(item):
+                            with ui.card().classes(
+                                "w-full p-2 flex flex-row items-center gap-4 bg-gray-50 border"
+                            ) as card:
+                                # Drag Handle
+                                ui.icon("drag_indicator").classes("text-gray-400 cursor-move")
+
+                                with ui.column().classes("flex-grow gap-2"):
+                                    # Header Row
+                                    with ui.row().classes("gap-2 items-center w-full"):
+                                        ui.label(f"Widget: {item.get('type')}").classes("font-bold")
+                                        ui.chip(item.get("tab", "overview")).props("dense outline")
+
+                                    # Standard Settings Row
+                                    with ui.row().classes("gap-4 w-full items-center flex-wrap"):
+                                        ui.select(
+                                            ["overview", "metrics", "diagnostics", "performance"],
+                                            value=item.get("tab", "overview"),
+                                            label="Tab",
+                                        ).bind_value_to(item, "tab").props("dense options-dense").classes("w-40")
+
+                                        ui.number(
+                                            value=item.get("col_span", 6), min=1, max=12, label="Span (1-12)"
+                                        ).bind_value_to(item, "col_span").props("dense debounce=200").classes("w-32")
+
+                                    # Custom Chart Settings Row
+                                    if item.get("type") == "custom_chart":
+                                        ui.separator()
+                                        with ui.row().classes("gap-4 w-full items-center flex-wrap"):
+                                            ui.input(value=item.get("title", "")).bind_value_to(item, "title").props(
+                                                "dense debounce=300 label='Title'"
+                                            ).classes("min-w-[200px] flex-grow")
+
+                                            ui.select(
+                                                ["line", "bar", "scatter"], value=item.get("chart_type", "line")
+                                            ).bind_value_to(item, "chart_type").props("dense").classes("w-32")
+
+                                            ui.input(value=item.get("x_axis", "timestamp")).bind_value_to(
+                                                item, "x_axis"
+                                            ).props("dense debounce=300 label='X-Axis'").classes("w-32")
+
+                                            ui.input(value=item.get("y_axis", "duration")).bind_value_to(
+                                                item, "y_axis"
+                                            ).props("dense debounce=300 label='Y-Axis'").classes("w-32")
+
+                                # Actions Column
+                                with ui.column().classes("gap-1 items-center"):
+                                    ui.button(icon="arrow_upward", on_click=lambda: move_item(item, -1)).props(
+                                        "flat dense round"
+                                    ).classes("text-gray-600")
+                                    ui.button(icon="arrow_downward", on_click=lambda: move_item(item, 1)).props(
+                                        "flat dense round"
+                                    ).classes("text-gray-600")
+                                    ui.button(icon="delete", on_click=lambda: remove_item(item)).props(
+                                        "flat dense round color=negative"
+                                    )
+                            return card
 
                         def render_layout_list():
                             layout_container.clear()
                             with layout_container:
-                                for idx, item in enumerate(settings["dashboard_layout"]):
-                                    with ui.card().classes(
-                                        "w-full p-2 flex flex-row items-center gap-4 bg-gray-50 border"
-                                    ):
-                                        # Drag Handle
-                                        ui.icon("drag_indicator").classes("text-gray-400 cursor-move")
-
-                                        with ui.column().classes("flex-grow gap-2"):
-                                            # Header Row
-                                            with ui.row().classes("gap-2 items-center w-full"):
-                                                ui.label(f"Widget: {item.get('type')}").classes("font-bold")
-                                                ui.chip(item.get("tab", "overview")).props("dense outline")
-
-                                            # Standard Settings Row
-                                            with ui.row().classes("gap-4 w-full items-center flex-wrap"):
-                                                ui.select(
-                                                    ["overview", "metrics", "diagnostics", "performance"],
-                                                    value=item.get("tab", "overview"),
-                                                    label="Tab",
-                                                ).bind_value(item, "tab").props("dense options-dense").classes("w-40")
-
-                                                ui.number(
-                                                    value=item.get("col_span", 6), min=1, max=12, label="Span (1-12)"
-                                                ).bind_value(item, "col_span").props("dense").classes("w-32")
-
-                                            # Custom Chart Settings Row
-                                            if item.get("type") == "custom_chart":
-                                                ui.separator()
-                                                with ui.row().classes("gap-4 w-full items-center flex-wrap"):
-                                                    ui.input(value=item.get("title", "")).bind_value(
-                                                        item, "title"
-                                                    ).props("dense label='Title'").classes("min-w-[200px] flex-grow")
-
-                                                    ui.select(
-                                                        ["line", "bar", "scatter"], value=item.get("chart_type", "line")
-                                                    ).bind_value(item, "chart_type").props("dense").classes("w-32")
-
-                                                    ui.input(value=item.get("x_axis", "timestamp")).bind_value(
-                                                        item, "x_axis"
-                                                    ).props("dense label='X-Axis'").classes("w-32")
-
-                                                    ui.input(value=item.get("y_axis", "duration")).bind_value(
-                                                        item, "y_axis"
-                                                    ).props("dense label='Y-Axis'").classes("w-32")
-
-                                        # Actions Column
-                                        with ui.column().classes("gap-1 items-center"):
-                                            ui.button(
-                                                icon="arrow_upward", on_click=lambda i=idx: move_item(i, -1)
-                                            ).props("flat dense round").classes("text-gray-600")
-                                            ui.button(
-                                                icon="arrow_downward", on_click=lambda i=idx: move_item(i, 1)
-                                            ).props("flat dense round").classes("text-gray-600")
-                                            ui.button(icon="delete", on_click=lambda i=idx: remove_item(i)).props(
-                                                "flat dense round color=negative"
-                                            )
-
-                        render_layout_list()
+                                layout_rows[:] = [build_layout_row(item) for item in settings["dashboard_layout"]]
+
                         ui.button("Add Custom Chart Widget", on_click=add_widget, icon="add").props("outline")
 
                 # --- Alert Builder Panel ---
@@ -839,79 +981,88 @@ def start_board(trace_file: str):
                         ui.label("Custom Alert Rules").classes("text-xl font-bold")
 
                         alerts_container = ui.column().classes("w-full gap-2")
+                        # Same approach as the layout list: one card per rule, patched in place
+                        alert_rows: List[ui.card] = []
 
                         def add_rule():
-                            settings["custom_alert_rules"].append(
-                                {
-                                    "name": "New Alert Rule",
-                                    "severity": "warning",
-                                    "conditions": [{"metric": "pss", "operator": "<", "value": 80}],
-                                    "module_pattern": "",
-                                }
-                            )
-                            render_alerts_list()
+                            rule = {
+                                "name": "New Alert Rule",
+                                "severity": "warning",
+                                "conditions": [{"metric": "pss", "operator": "<", "value": 80}],
+                                "module_pattern": "",
+                            }
+                            settings["custom_alert_rules"].append(rule)
+                            with alerts_container:
+                                alert_rows.append(build_rule_row(rule))
 
-                        def remove_rule(idx):
+                        def remove_rule(rule):
+                            idx = _position(settings["custom_alert_rules"], rule)
                             del settings["custom_alert_rules"][idx]
-                            render_alerts_list()
+                            alert_rows.pop(idx).delete()
+
+                        def build_condition_row(rule, cond, no_conditions):
+                            def remove_condition():
+                                conditions = rule["conditions"]
+                                del conditions[_position(conditions, cond)]
+                                row.delete()
+                                no_conditions.set_visibility(not conditions)
+
+                            with ui.row().classes("items-center gap-2") as row:
+                                ui.input(value=cond.get("metric")).bind_value_to(cond, "metric").props(
+                                    "dense debounce=300 label='Metric'"
+                                ).classes("w-32")
+                                ui.select(["<", "<=", ">", ">=", "=="], value=cond.get("operator")).bind_value_to(
+                                    cond, "operator"
+                                ).props("dense").classes("w-16")
+                                ui.number(value=cond.get("value")).bind_value_to(cond, "value").props(
+                                    "dense debounce=200 label='Value'"
+                                ).classes("w-24")
+                                ui.button(icon="close", on_click=remove_condition).props(
+                                    "flat dense round size=xs color=grey"
+                                )
 
-                        def add_condition(rule):
-                            rule.setdefault("conditions", []).append({"metric": "pss", "operator": "<", "value": 80})
-                            render_alerts_list()
+                        def build_rule_row(rule):
+                            with ui.card().classes("w-full p-4 bg-gray-50 border") as card:
+                                with ui.row().classes("w-full items-center justify-between mb-2"):
+                                    ui.input(value=rule.get("name")).bind_value_to(rule, "name").props(
+                                        "dense debounce=300 label='Rule Name'"
+                                    ).classes("w-64")
+                                    ui.select(
+                                        ["info", "warning", "critical"], value=rule.get("severity", "warning")
+                                    ).bind_value_to(rule, "severity").props("dense label='Severity'").classes("w-32")
+                                    ui.input(value=rule.get("module_pattern", "")).bind_value_to(
+                                        rule, "module_pattern"
+                                    ).props("dense debounce=300 label='Module Pattern (Regex)'").classes("w-64")
+                                    ui.button(icon="delete", on_click=lambda: remove_rule(rule)).props(
+                                        "flat dense round color=negative"
+                                    )
 
-                        def remove_condition(rule, c_idx):
-                            del rule["conditions"][c_idx]
-                            render_alerts_list()
+                                ui.label("Conditions (ALL must match):").classes("text-xs font-bold text-gray-500 mb-1")
+                                with ui.column().classes("w-full gap-1 pl-4 border-l-2 border-gray-300"):
+                                    no_conditions = ui.label("No conditions").classes("text-xs italic")
+                                    no_conditions.set_visibility(not rule.get("conditions"))
+                                    conditions_column = ui.column().classes("w-full gap-1")
+                                    with conditions_column:
+                                        for cond in rule.get("conditions", []):
+                                            build_condition_row(rule, cond, no_conditions)
+
+                                    def add_condition():
+                                        cond = {"metric": "pss", "operator": "<", "value": 80}
+                                        rule.setdefault("conditions", []).append(cond)
+                                        no_conditions.set_visibility(False)
+                                        with conditions_column:
+                                            build_condition_row(rule, cond, no_conditions)
+
+                                    ui.button("Add Condition", on_click=add_condition).props(
+                                        "flat dense size=sm color=primary"
+                                    )
+                            return card
 
                         def render_alerts_list():
                             alerts_container.clear()
                             with alerts_container:
-                                for idx, rule in enumerate(settings["custom_alert_rules"]):
-                                    with ui.card().classes("w-full p-4 bg-gray-50 border"):
-                                        with ui.row().classes("w-full items-center justify-between mb-2"):
-                                            ui.input(value=rule.get("name")).bind_value(rule, "name").props(
-                                                "dense label='Rule Name'"
-                                            ).classes("w-64")
-                                            ui.select(
-                                                ["info", "warning", "critical"], value=rule.get("severity", "warning")
-                                            ).bind_value(rule, "severity").props("dense label='Severity'").classes(
-                                                "w-32"
-                                            )
-                                            ui.input(value=rule.get("module_pattern", "")).bind_value(
-                                                rule, "module_pattern"
-                                            ).props("dense label='Module Pattern (Regex)'").classes("w-64")
-                                            ui.button(icon="delete", on_click=lambda i=idx: remove_rule(i)).props(
-                                                "flat dense round color=negative"
-                                            )
-
-                                        ui.label("Conditions (ALL must match):").classes(
-                                            "text-xs font-bold text-gray-500 mb-1"
-                                        )
-                                        with ui.column().classes("w-full gap-1 pl-4 border-l-2 border-gray-300"):
-                                            if not rule.get("conditions"):
-                                                ui.label("No conditions").classes("text-xs italic")
-
-                                            for c_idx, cond in enumerate(rule.get("conditions", [])):
-                                                with ui.row().classes("items-center gap-2"):
-                                                    ui.input(value=cond.get("metric")).bind_value(cond, "metric").props(
-                                                        "dense label='Metric'"
-                                                    ).classes("w-32")
-                                                    ui.select(
-                                                        ["<", "<=", ">", ">=", "=="], value=cond.get("operator")
-                                                    ).bind_value(cond, "operator").props("dense").classes("w-16")
-                                                    ui.number(value=cond.get("value")).bind_value(cond, "value").props(
-                                                        "dense label='Value'"
-                                                    ).classes("w-24")
-                                                    ui.button(
-                                                        icon="close",
-                                                        on_click=lambda r=rule, i=c_idx: remove_condition(r, i),
-                                                    ).props("flat dense round size=xs color=grey")
-
-                                            ui.button("Add Condition", on_click=lambda r=rule: add_condition(r)).props(
-                                                "flat dense size=sm color=primary"
-                                            )
-
-                        render_alerts_list()
+                                alert_rows[:] = [build_rule_row(rule) for rule in settings["custom_alert_rules"]]
+
                         ui.button("Add New Alert Rule", on_click=add_rule, icon="add_alert").props("outline")
 
             # --- Dialog Footer / Action Buttons ---
@@ -920,31 +1071,27 @@ def start_board(trace_file: str):
                 ui.button("Save Changes", on_click=lambda: save_settings()).props("color=primary")
 
         def save_settings():
-            # Update GLOBAL_CONFIG from the settings dictionary
-            GLOBAL_CONFIG.sample_rate = settings["sample_rate"]
-            GLOBAL_CONFIG.max_traces = int(settings["max_traces"])
-            GLOBAL_CONFIG.w_ts = settings["w_ts"]
-            GLOBAL_CONFIG.w_ms = settings["w_ms"]
-            GLOBAL_CONFIG.w_ev = settings["w_ev"]
-            GLOBAL_CONFIG.w_be = settings["w_be"]
-            GLOBAL_CONFIG.w_cc = settings["w_cc"]
-            GLOBAL_CONFIG.alpha = settings["alpha"]
-            GLOBAL_CONFIG.beta = settings["beta"]
-            GLOBAL_CONFIG.gamma = settings["gamma"]
-            GLOBAL_CONFIG.mem_spike_threshold_ratio = settings["mem_spike_threshold_ratio"]
-            GLOBAL_CONFIG.delta = settings["delta"]
-            GLOBAL_CONFIG.error_spike_threshold = settings["error_spike_threshold"]
-            GLOBAL_CONFIG.consecutive_error_threshold = int(settings["consecutive_error_threshold"])
-            GLOBAL_CONFIG.concurrency_wait_threshold = settings["concurrency_wait_threshold"]
-
-            # Save new lists
-            GLOBAL_CONFIG.dashboard_layout = settings["dashboard_layout"]
-            GLOBAL_CONFIG.custom_alert_rules = settings["custom_alert_rules"]
+            # Settings dictionary entries map 1:1 to GLOBAL_CONFIG fields; the layout and alert lists
+            # are only present if their tab was opened for editing
+            updates = dict(settings)
+            updates["max_traces"] = int(settings["max_traces"])
+            updates["consecutive_error_threshold"] = int(settings["consecutive_error_threshold"])
+            changed = {key: value for key, value in updates.items() if getattr(GLOBAL_CONFIG, key) != value}
+            if not changed:
+                # Nothing to write, and the dashboard (with its cached layout grouping and figures) stays as is
+                ui.notify("No changes to save.")
+                dialog.close()
+                return
+
+            for key, value in changed.items():
+                setattr(GLOBAL_CONFIG, key, value)
 
             GLOBAL_CONFIG.save()  # Save to pypss.toml
             ui.notify("Settings saved and dashboard refreshed!", type="positive")
             dialog.close()
-            content.refresh()  # Refresh main dashboard to apply new settings
+            # Reload rather than re-render the stored data: reports are memoized per scoring settings,
+            # so new weights and thresholds are applied to the current trace file
+            background_tasks.create(reload(), name="reload trace data")
 
         dialog.open()
 
@@ -965,7 +1112,10 @@ def start_board(trace_file: str):
         if on_click:
             card_classes += " cursor-pointer hover:shadow-md transition-shadow"
 
-        card = ui.card().classes(card_classes).on("click", on_click if on_click else lambda: None)
+        card = ui.card().classes(card_classes)
+        if on_click:
+            # Only clickable cards get a listener; a no-op one would still send every click to the server
+            card.on("click", on_click)
         with card:
             with ui.row().classes("justify-between items-start w-full"):
                 with ui.column().classes("gap-1"):
@@ -999,11 +1149,9 @@ def start_board(trace_file: str):
             " flex flex-col justify-between"
         ):
             with ui.row().classes("w-full pb-2 mb-2 border-b border-gray-200 items-center justify-between"):
-                ui.label("Overall PSS").classes("font-bold text-gray-700 text-lg").tooltip(
-                    "0-100 Stability Score. Higher is better."
-                )
-                ui.icon("speed", size="sm").classes("text-gray-400")
-            ui.plotly(create_gauge_chart(report["pss"], "")).classes("w-full h-40")
+                ui.label("Overall PSS").classes(CARD_TITLE_CLASSES).tooltip("0-100 Stability Score. Higher is better.")
+                ui.icon("speed", size="sm").classes(CARD_ICON_CLASSES)
+            ui.plotly(gauge_chart_data(report["pss"], "")).classes("w-full h-40")
 
     @register_widget("total_traces_kpi")
     def _render_total_traces_kpi(
@@ -1013,7 +1161,7 @@ def start_board(trace_file: str):
         processor: Optional[TraceProcessor] = None,
         widget_config: Optional[Dict[str, Any]] = None,
     ):
-        total = len(raw_traces)
+        total = (processor or TraceProcessor(raw_traces)).get_kpis()["total"]
         widget_config = widget_config if widget_config is not None else {}
         kpi_card(
             title="Total Traces",
@@ -1031,9 +1179,9 @@ def start_board(trace_file: str):
         processor: Optional[TraceProcessor] = None,
         widget_config: Optional[Dict[str, Any]] = None,
     ):
-        total = len(raw_traces)
-        error_count = len([t for t in raw_traces if t.get("error")])
-        error_rate = (error_count / total) if total > 0 else 0.0
+        kpis = (processor or TraceProcessor(raw_traces)).get_kpis()
+        error_count = kpis["error_count"]
+        error_rate = kpis["error_rate"]
 
         color_class = "text-green-600"
         if error_rate > 0.05:
@@ -1058,10 +1206,8 @@ def start_board(trace_file: str):
         processor: Optional[TraceProcessor] = None,
         widget_config: Optional[Dict[str, Any]] = None,
     ):
-        if not raw_traces:
-            avg_lat = 0.0
-        else:
-            avg_lat = sum(float(t.get("duration", 0)) for t in raw_traces) / len(raw_traces)
+        kpis = (processor or TraceProcessor(raw_traces)).get_kpis()
+        avg_lat = kpis["duration_mean"]
 
         widget_config = widget_config if widget_config is not None else {}
         kpi_card(
@@ -1086,30 +1232,11 @@ def start_board(trace_file: str):
             f"col-span-12 md:col-span-{col_span} shadow-sm border border-gray-200 bg-white p-4 flex flex-col"
         ):
             with ui.row().classes("w-full pb-2 border-b border-gray-200 items-center justify-between"):
-                ui.label("Metric Breakdown").classes("font-bold text-gray-700 text-lg")
-                ui.icon("monitoring", size="sm").classes("text-gray-400")
-
-            # Vertical list layout for gauges (Compact)
-            with ui.column().classes("w-full gap-3 mt-2"):
-                for metric_name, score_value in report["breakdown"].items():
-                    with ui.row().classes("w-full items-center justify-between"):
-                        score_color_class = (
-                            "text-green-600"
-                            if score_value >= 0.90
-                            else "text-amber-500"
-                            if score_value >= 0.70
-                            else "text-red-600"
-                        )
-                        progress_color = (
-                            "positive" if score_value >= 0.9 else "warning" if score_value >= 0.7 else "negative"
-                        )
-                        ui.label(metric_name.replace("_", " ").title()).classes("text-sm font-medium text-gray-600")
+                ui.label("Metric Breakdown").classes(CARD_TITLE_CLASSES)
+                ui.icon("monitoring", size="sm").classes(CARD_ICON_CLASSES)
 
-                        with ui.row().classes("items-center gap-3"):
-                            ui.label(f"{int(score_value * 100)}").classes(f"text-sm font-bold {score_color_class}")
-                            ui.linear_progress(value=score_value, show_value=False).props(
-                                f"color={progress_color}"
-                            ).classes("w-24")
+            # Vertical list layout for gauges (Compact), sent as one static HTML element
+            ui.html(metric_breakdown_html(report["breakdown"])).classes("w-full mt-2")
 
     @register_widget("ai_advisor")
     def _render_ai_advisor(
@@ -1121,7 +1248,6 @@ def start_board(trace_file: str):
     ):
         widget_config = widget_config if widget_config is not None else {}
         col_span = widget_config.get("col_span", 8)
-        analysis_text, recommendations_text = generate_ai_diagnostics(report, df)
         with ui.card().classes(
             f"col-span-12 md:col-span-{col_span} shadow-sm border border-gray-200 bg-white p-6 flex flex-col"
         ):
@@ -1129,13 +1255,38 @@ def start_board(trace_file: str):
                 ui.icon("auto_awesome", size="md").classes("text-purple-600")
                 ui.label("AI Diagnostics").classes("text-xl font-bold text-gray-800")
 
-            with ui.scroll_area().classes("h-64 w-full pr-2"):
-                ui.markdown(f"**Analysis:**\n{analysis_text}").classes(
-                    "text-sm text-gray-600 leading-relaxed font-mono"
-                )
-                ui.markdown(f"**Recommendations:**\n{recommendations_text}").classes(
-                    "text-sm text-gray-600 leading-relaxed font-mono mt-4"
-                )
+            scroll_area = ui.scroll_area().classes("h-64 w-full pr-2")
+
+            def show_diagnostics(result: Tuple[str, str]):
+                analysis_text, recommendations_text = result
+                scroll_area.clear()
+                with scroll_area:
+                    ui.markdown(f"**Analysis:**\n{analysis_text}").classes(
+                        "text-sm text-gray-600 leading-relaxed font-mono"
+                    )
+                    ui.markdown(f"**Recommendations:**\n{recommendations_text}").classes(
+                        "text-sm text-gray-600 leading-relaxed font-mono mt-4"
+                    )
+
+            # The advisor output only depends on the loaded report, so unchanged data reuses it
+            key = (data_key(report, raw_traces), tuple(sorted(report.get("breakdown", {}).items())))
+            cached = _diagnostics_cache.get("ai_advisor")
+            if cached is not None and cached[0] == key:
+                show_diagnostics(cached[1])
+                return
+
+            with scroll_area:
+                ui.spinner(size="lg", color="primary")
+
+            async def fill_diagnostics():
+                result = await run.io_bound(generate_ai_diagnostics, report, df)
+                if result is None:
+                    return
+                _diagnostics_cache["ai_advisor"] = (key, result)
+                if not scroll_area.is_deleted:
+                    show_diagnostics(result)
+
+            ui.timer(0, fill_diagnostics, once=True)
 
     @register_widget("historical_trend")
     def _render_historical_trend(
@@ -1147,27 +1298,40 @@ def start_board(trace_file: str):
     ):
         widget_config = widget_config if widget_config is not None else {}
         col_span = widget_config.get("col_span", 6)
-        # Load History
-        history_data = []
-        try:
-            storage = get_storage_backend(
-                {
-                    "storage_backend": GLOBAL_CONFIG.storage_backend,
-                    "storage_uri": GLOBAL_CONFIG.storage_uri,
-                }
-            )
-            history_data = storage.get_history(limit=50)
-            history_data.reverse()  # Sort by timestamp ascending for the chart (oldest first)
-        except Exception:
-            pass  # Silently fail if storage not configured or db missing
+        with ui.card().classes(f"col-span-12 lg:col-span-{col_span} {CARD_CLASSES}"):
+            with ui.row().classes(CARD_HEADER_CLASSES):
+                ui.label("Long-term Stability History").classes(CARD_TITLE_CLASSES)
+                ui.icon("history", size="sm").classes(CARD_ICON_CLASSES)
+
+            history_container = ui.column().classes("w-full items-center justify-center")
+            storage_key = (GLOBAL_CONFIG.storage_backend, GLOBAL_CONFIG.storage_uri)
+            cached = _history_cache.get(storage_key)
+            if cached is not None and time.monotonic() - cached[0] < HISTORY_CACHE_TTL:
+                with history_container:
+                    ui.plotly(cached[1]).classes("w-full h-96")
+                return
 
-        with ui.card().classes(
-            f"col-span-12 lg:col-span-{col_span} shadow-sm border border-gray-200 bg-white p-0 flex flex-col"
-        ):
-            with ui.row().classes("w-full p-4 border-b border-gray-200 items-center justify-between"):
-                ui.label("Long-term Stability History").classes("font-bold text-gray-700 text-lg")
-                ui.icon("history", size="sm").classes("text-gray-400")
-            ui.plotly(create_historical_chart(history_data)).classes("w-full h-96")
+            with history_container:
+                ui.spinner(size="lg", color="primary").classes("m-8")
+
+            async def fill_history():
+                # Load History without blocking the event loop
+                history_data = []
+                try:
+                    history_data = await history_storage().get_history_async(limit=50)
+                    history_data.reverse()  # Sort by timestamp ascending for the chart (oldest first)
+                except Exception:
+                    pass  # Silently fail if storage not configured or db missing
+                fig = historical_chart_data(history_data)
+                _history_cache.clear()
+                _history_cache[storage_key] = (time.monotonic(), fig)
+                if history_container.is_deleted:
+                    return
+                history_container.clear()
+                with history_container:
+                    ui.plotly(fig).classes("w-full h-96")
+
+            ui.timer(0, fill_history, once=True)
 
     @register_widget("module_table")
     def _render_module_table(
@@ -1181,17 +1345,13 @@ def start_board(trace_file: str):
         col_span = widget_config.get("col_span", 6)
         with ui.card().classes(f"col-span-12 lg:col-span-{col_span} shadow-sm border border-gray-200 bg-white p-0"):
             if df is not None and not df.empty:
-                table_rows = df.to_dict("records")
-                for row in table_rows:
-                    if "timing" in row:
-                        row["timing"] = f"{row['timing']:.2f}"
-                    if "errors" in row:
-                        row["errors"] = f"{row['errors']:.2f}"
+                # Paginated and sorted server-side: only the visible page is formatted and sent
+                pagination = {"page": 1, "rowsPerPage": 10, "sortBy": None, "descending": False, "rowsNumber": len(df)}
 
-                with ui.row().classes("w-full p-4 border-b border-gray-200 items-center justify-between"):
-                    ui.label("Module Performance").classes("font-bold text-gray-700 text-lg")
+                with ui.row().classes(CARD_HEADER_CLASSES):
+                    ui.label("Module Performance").classes(CARD_TITLE_CLASSES)
 
-                ui.table(
+                module_table = ui.table(
                     columns=[
                         {
                             "name": "module",
@@ -1234,14 +1394,29 @@ def start_board(trace_file: str):
                             "align": "right",
                         },
                     ],
-                    rows=table_rows,
+                    rows=table_page(df, pagination, decimals=("timing", "errors")),
                     row_key="module",
-                    pagination=10,
-                ).classes("w-full flat-table").on(
-                    "cell_click",
-                    lambda e: show_module_detail_dialog(report, df, raw_traces, e.args[1]["module"])
-                    if e.args[0]["name"] == "module"
-                    else None,
+                    pagination=pagination,
+                ).classes("w-full flat-table")
+
+                def load_module_page(e):
+                    page = {**e.args["pagination"], "rowsNumber": len(df)}
+                    module_table.rows = table_page(df, page, decimals=("timing", "errors"))
+                    module_table.pagination = page
+
+                module_table.on("request", load_module_page)
+                # Only clicks on the module cell reach the server; other cells are handled entirely client-side
+                module_table.add_slot(
+                    "body-cell-module",
+                    """
+                    <q-td :props="props" @click="$parent.$emit('module_click', props.row.module)">
+                        {{ props.value }}
+                    </q-td>
+                    """,
+                )
+                module_table.on(
+                    "module_click",
+                    lambda e: show_module_detail_dialog(report, df, raw_traces, e.args, processor),
                 )
             else:
                 ui.label("No module performance data available.").classes("text-gray-500 italic p-4")
@@ -1256,9 +1431,7 @@ def start_board(trace_file: str):
     ):
         widget_config = widget_config if widget_config is not None else {}
         col_span = widget_config.get("col_span", 12)
-        with ui.card().classes(
-            f"col-span-12 lg:col-span-{col_span} shadow-sm border border-gray-200 bg-white p-0 flex flex-col"
-        ):
+        with ui.card().classes(f"col-span-12 lg:col-span-{col_span} {CARD_CLASSES}"):
             with ui.row().classes("items-center justify-between w-full p-4 border-b border-gray-200"):
                 ui.label("Real-time Stability Trends").classes("text-xl font-bold text-gray-800")
 
@@ -1268,18 +1441,51 @@ def start_board(trace_file: str):
                     label="Window Size",
                 ).classes("w-32")
 
-            @ui.refreshable
-            def refresh_metrics_chart():
-                if not processor:
+            if not processor:
+                return
+
+            # One plot element for the widget's lifetime; window changes update its figure in place
+            # (Plotly.react on the client) instead of mounting a new chart.
+            chart_container = ui.column().classes("w-full items-center justify-center")
+            with chart_container:
+                ui.spinner(size="lg", color="primary").classes("m-8")
+            chart: Optional[ui.plotly] = None
+
+            async def update_metrics_chart():
+                nonlocal chart
+                window = window_size.value
+                key = (data_key(report, raw_traces), processor.timeseries_key(window))
+                cached = _figure_cache.get("stability_trends")
+                if cached is not None and cached[0] == key:
+                    fig = cached[1]
+                else:
+                    try:
+                        fig = await run.io_bound(
+                            lambda: figure_data(plot_stability_trends(processor.get_metric_timeseries(window)))
+                        )
+                    except Exception as e:
+                        if not chart_container.is_deleted and window_size.value == window:
+                            # The next window change mounts a fresh chart in place of the error
+                            chart = None
+                            chart_container.clear()
+                            with chart_container:
+                                ui.label(f"Error loading chart: {e}").classes("text-red-500 p-4")
+                        return
+                    if fig is None:
+                        return
+                    _figure_cache["stability_trends"] = (key, fig)
+                # Drop results for a window the user has already moved away from
+                if chart_container.is_deleted or window_size.value != window:
                     return
-                try:
-                    ts_df = processor.get_metric_timeseries(window_size.value)
-                    ui.plotly(plot_stability_trends(ts_df)).classes("w-full h-[600px]")
-                except Exception as e:
-                    ui.label(f"Error loading metrics chart: {e}").classes("text-red-500 p-4")
+                if chart is None:
+                    chart_container.clear()
+                    with chart_container:
+                        chart = ui.plotly(fig).classes("w-full h-[600px]")
+                else:
+                    chart.update_figure(fig)
 
-            window_size.on_value_change(refresh_metrics_chart.refresh)
-            refresh_metrics_chart()
+            window_size.on_value_change(update_metrics_chart)
+            ui.timer(0, update_metrics_chart, once=True)
 
     @register_widget("error_heatmap")
     def _render_error_heatmap(
@@ -1291,12 +1497,16 @@ def start_board(trace_file: str):
     ):
         widget_config = widget_config if widget_config is not None else {}
         col_span = widget_config.get("col_span", 6)
-        with ui.card().classes(
-            f"col-span-12 md:col-span-{col_span} shadow-sm border border-gray-200 bg-white p-0 flex flex-col"
-        ):
+        with ui.card().classes(f"col-span-12 md:col-span-{col_span} {CARD_CLASSES}"):
             with ui.row().classes("w-full p-4 border-b border-gray-200"):
-                ui.label("Error Clusters").classes("font-bold text-gray-700 text-lg")
-            ui.plotly(plot_error_heatmap(raw_traces)).classes("w-full h-80")
+                ui.label("Error Clusters").classes(CARD_TITLE_CLASSES)
+            cached_plotly(
+                "error_heatmap",
+                data_key(report, raw_traces),
+                plot_error_heatmap,
+                chart_input(raw_traces, processor),
+                classes="w-full h-80",
+            )
 
     @register_widget("entropy_heatmap")
     def _render_entropy_heatmap(
@@ -1308,12 +1518,16 @@ def start_board(trace_file: str):
     ):
         widget_config = widget_config if widget_config is not None else {}
         col_span = widget_config.get("col_span", 6)
-        with ui.card().classes(
-            f"col-span-12 md:col-span-{col_span} shadow-sm border border-gray-200 bg-white p-0 flex flex-col"
-        ):
+        with ui.card().classes(f"col-span-12 md:col-span-{col_span} {CARD_CLASSES}"):
             with ui.row().classes("w-full p-4 border-b border-gray-200"):
-                ui.label("Logic Complexity").classes("font-bold text-gray-700 text-lg")
-            ui.plotly(plot_entropy_heatmap(raw_traces)).classes("w-full h-80")
+                ui.label("Logic Complexity").classes(CARD_TITLE_CLASSES)
+            cached_plotly(
+                "entropy_heatmap",
+                data_key(report, raw_traces),
+                plot_entropy_heatmap,
+                chart_input(raw_traces, processor),
+                classes="w-full h-80",
+            )
 
     @register_widget("latency_percentiles_chart")
     def _render_latency_percentiles_chart(
@@ -1325,13 +1539,17 @@ def start_board(trace_file: str):
     ):
         widget_config = widget_config if widget_config is not None else {}
         col_span = widget_config.get("col_span", 12)
-        with ui.card().classes(
-            f"col-span-12 md:col-span-{col_span} shadow-sm border border-gray-200 bg-white p-0 flex flex-col"
-        ):
-            with ui.row().classes("w-full p-4 border-b border-gray-200 items-center justify-between"):
-                ui.label("Latency Percentiles").classes("font-bold text-gray-700 text-lg")
-                ui.icon("show_chart", size="sm").classes("text-gray-400")
-            ui.plotly(create_trend_chart(raw_traces)).classes("w-full h-80")
+        with ui.card().classes(f"col-span-12 md:col-span-{col_span} {CARD_CLASSES}"):
+            with ui.row().classes(CARD_HEADER_CLASSES):
+                ui.label("Latency Percentiles").classes(CARD_TITLE_CLASSES)
+                ui.icon("show_chart", size="sm").classes(CARD_ICON_CLASSES)
+            cached_plotly(
+                "latency_percentiles",
+                data_key(report, raw_traces),
+                create_trend_chart,
+                chart_input(raw_traces, processor),
+                classes="w-full h-80",
+            )
 
     @register_widget("concurrency_distribution")
     def _render_concurrency_distribution(
@@ -1343,13 +1561,17 @@ def start_board(trace_file: str):
     ):
         widget_config = widget_config if widget_config is not None else {}
         col_span = widget_config.get("col_span", 12)
-        with ui.card().classes(
-            f"col-span-12 md:col-span-{col_span} shadow-sm border border-gray-200 bg-white p-0 flex flex-col"
-        ):
-            with ui.row().classes("w-full p-4 border-b border-gray-200 items-center justify-between"):
-                ui.label("Concurrency Wait Times").classes("font-bold text-gray-700 text-lg")
-                ui.icon("speed", size="sm").classes("text-gray-400")
-            ui.plotly(plot_concurrency_dist(raw_traces)).classes("w-full h-80")
+        with ui.card().classes(f"col-span-12 md:col-span-{col_span} {CARD_CLASSES}"):
+            with ui.row().classes(CARD_HEADER_CLASSES):
+                ui.label("Concurrency Wait Times").classes(CARD_TITLE_CLASSES)
+                ui.icon("speed", size="sm").classes(CARD_ICON_CLASSES)
+            cached_plotly(
+                "concurrency_distribution",
+                data_key(report, raw_traces),
+                plot_concurrency_dist,
+                chart_input(raw_traces, processor),
+                classes="w-full h-80",
+            )
 
     @register_widget("custom_chart")
     def _render_custom_chart(
@@ -1361,12 +1583,19 @@ def start_board(trace_file: str):
     ):
         widget_config = widget_config if widget_config is not None else {}
         col_span = widget_config.get("col_span", 6)
-        with ui.card().classes(
-            f"col-span-12 md:col-span-{col_span} shadow-sm border border-gray-200 bg-white p-0 flex flex-col"
-        ):
-            with ui.row().classes("w-full p-4 border-b border-gray-200 items-center justify-between"):
-                ui.label(widget_config.get("title", "Custom Chart")).classes("font-bold text-gray-700 text-lg")
-            ui.plotly(create_custom_chart(raw_traces, widget_config)).classes("w-full h-80")
+        with ui.card().classes(f"col-span-12 md:col-span-{col_span} {CARD_CLASSES}"):
+            with ui.row().classes(CARD_HEADER_CLASSES):
+                ui.label(widget_config.get("title", "Custom Chart")).classes(CARD_TITLE_CLASSES)
+            # Keyed on the settings that shape the figure, so identical charts on several tabs share one entry
+            chart_spec = {k: v for k, v in widget_config.items() if k not in ("type", "tab", "col_span")}
+            cached_plotly(
+                f"custom_chart:{sorted(chart_spec.items())!r}",
+                data_key(report, raw_traces),
+                create_custom_chart,
+                chart_input(raw_traces, processor),
+                widget_config,
+                classes="w-full h-80",
+            )
 
     # --- LAYOUT ---
     ui.query("body").classes("bg-white flex flex-col h-screen")
@@ -1393,10 +1622,14 @@ def start_board(trace_file: str):
         # Right Actions (Theme-aware)
         with ui.row().classes("items-center gap-4"):
             # Data Freshness
-            freshness_label = ui.label("Data: --").classes("text-xs font-mono font-bold text-gray-500")
+            ui.label().classes("text-xs font-mono font-bold text-gray-500").bind_text_from(
+                header_state.watch(trace_file), "freshness"
+            )
 
             # Clock
-            clock_label = ui.label().classes("text-xs font-mono text-gray-600 border-r border-gray-300 pr-4")
+            ui.label().classes("text-xs font-mono text-gray-600 border-r border-gray-300 pr-4").bind_text_from(
+                header_state, "clock"
+            )
 
             # Status Indicator
             with ui.row().classes("items-center gap-2 bg-gray-50 rounded-full px-3 py-1 border border-gray-200"):
@@ -1407,6 +1640,7 @@ def start_board(trace_file: str):
             anomaly_alert_icon = ui.icon("warning", size="20px").classes("text-red-500 hidden")
             with anomaly_alert_icon:
                 anomaly_tooltip = ui.tooltip("No anomalies detected.")
+            anomaly_shown = False
 
             # Help Button
             ui.button(icon="help_outline", on_click=show_help).props("flat round dense color=grey-7").tooltip(
@@ -1421,29 +1655,24 @@ def start_board(trace_file: str):
 
             # Theme Toggle (Icon color adjusts)
 
+    def set_anomaly_alert(shown: bool, message: str):
+        # Only touch the icon classes when visibility flips; each call pushes a DOM patch.
+        nonlocal anomaly_shown
+        if shown != anomaly_shown:
+            anomaly_shown = shown
+            if shown:
+                anomaly_alert_icon.classes(replace="hidden", add="text-red-500 animate-pulse")
+            else:
+                anomaly_alert_icon.classes(replace="text-red-500 animate-pulse", add="hidden")
+        anomaly_tooltip.set_text(message)
+
     # --- DYNAMIC CONTENT ---
     # This will be the main content wrapper background, allowing normal scrolling
     with ui.column().classes("w-full bg-gray-50 p-6 gap-6 flex-grow overflow-y-auto"):
 
         @ui.refreshable
-        def content():
-            report, df, raw_traces, processor = load_trace_data(trace_file)
-
-            # Load History
-            history_data = []
-            try:
-                storage = get_storage_backend(
-                    {
-                        "storage_backend": GLOBAL_CONFIG.storage_backend,
-                        "storage_uri": GLOBAL_CONFIG.storage_uri,
-                    }
-                )
-                history_data = storage.get_history(limit=50)
-                # Sort by timestamp ascending for the chart (oldest first)
-                history_data.reverse()
-            except Exception:
-                # Silently fail if storage not configured or db missing
-                pass
+        def content(data: Tuple[Any, ...]):
+            report, df, raw_traces, processor = data
 
             if not report:
                 with ui.column().classes("w-full h-[80vh] items-center justify-center bg-white"):
@@ -1451,18 +1680,12 @@ def start_board(trace_file: str):
                     ui.label("Waiting for Trace Data...").classes("text-2xl font-light text-gray-500 mt-4")
                     ui.spinner(size="lg", color="primary").classes("mt-4")
                 # Hide anomaly icon if no data
-                anomaly_alert_icon.classes(replace="text-red-500 animate-pulse", add="hidden")
-                anomaly_tooltip.set_text("No data to analyze.")
+                set_anomaly_alert(False, "No data to analyze.")
                 return
 
             # Check for anomalies and update alert icon
-            is_anomaly, anomaly_message = check_for_anomalies(report, raw_traces)
-            if is_anomaly:
-                anomaly_alert_icon.classes(replace="hidden", add="text-red-500 animate-pulse")
-                anomaly_tooltip.set_text(anomaly_message)
-            else:
-                anomaly_alert_icon.classes(replace="text-red-500 animate-pulse", add="hidden")
-                anomaly_tooltip.set_text("No anomalies detected.")
+            is_anomaly, anomaly_message = check_for_anomalies(report, processor.get_kpis())
+            set_anomaly_alert(is_anomaly, anomaly_message if is_anomaly else "No anomalies detected.")
 
             # --- TABS LAYOUT ---
             with ui.tabs().classes("w-full text-gray-700") as tabs:
@@ -1471,84 +1694,78 @@ def start_board(trace_file: str):
                 ui.tab("diagnostics", icon="bug_report", label="Diagnostics")
                 ui.tab("performance", icon="speed", label="Performance")
 
-            with ui.tab_panels(tabs, value="overview").classes("w-full bg-transparent"):
-                # --- TAB 1: OVERVIEW ---
-                with ui.tab_panel("overview").classes("p-0 gap-6"):
-                    _render_tab_content("overview", report, df, raw_traces, processor)
-
-                # --- TAB 2: METRICS (DEEP DIVE) ---
-                with ui.tab_panel("metrics").classes("p-0 gap-6"):
-                    _render_tab_content("metrics", report, df, raw_traces, processor)
-
-                # --- TAB 3: DIAGNOSTICS ---
-                with ui.tab_panel("diagnostics").classes("p-0 gap-6"):
-                    _render_tab_content("diagnostics", report, df, raw_traces, processor)
-
-                # --- TAB 4: PERFORMANCE ---
-                with ui.tab_panel("performance").classes("p-0 gap-6"):
-                    _render_tab_content("performance", report, df, raw_traces, processor)
-
-    # --- HEADER UPDATES ---
-    def update_header_stats():
-        # Update Clock
-        try:
-            # Use astimezone() for local time awareness
-            now = datetime.now().astimezone()
-            clock_label.set_text(now.strftime("%Y-%m-%d %H:%M:%S %Z"))
-        except Exception:
-            clock_label.set_text(datetime.now().strftime("%Y-%m-%d %H:%M:%S"))
-
-        # Update Freshness
-        if last_mtime > 0:
-            age = time.time() - last_mtime
-            if age < 60:
-                freshness_label.set_text(f"Data: {int(age)}s ago")
-            elif age < 3600:
-                freshness_label.set_text(f"Data: {int(age / 60)}m ago")
-            else:
-                freshness_label.set_text(f"Data: {int(age / 3600)}h ago")
-        else:
-            freshness_label.set_text("Data: Pending")
+            # Panels are filled on first activation, so only the visible tab is built up front
+            with ui.tab_panels(tabs, value="overview").classes("w-full bg-transparent") as tab_panels:
+                panels = {
+                    name: ui.tab_panel(name).classes("p-0 gap-6")
+                    for name in ("overview", "metrics", "diagnostics", "performance")
+                }
+            for panel in panels.values():
+                with panel:
+                    ui.skeleton(height="24rem").classes("w-full")
+            built: Set[str] = set()
+
+            def build_tab(name: str):
+                panel = panels.get(name)
+                if panel is None or name in built:
+                    return
+                built.add(name)
+                panel.clear()
+                with panel:
+                    _render_tab_content(name, report, df, raw_traces, processor)
 
-    ui.timer(1.0, update_header_stats)
+            build_tab(tab_panels.value)
+            tab_panels.on_value_change(lambda e: build_tab(e.value))
 
     # --- REFRESH LOGIC ---
-    def check_refresh():
-        nonlocal last_mtime
-        if not os.path.exists(trace_file):
-            return
-        try:
-            mtime = os.path.getmtime(trace_file)
-            if mtime > last_mtime:
-                last_mtime = mtime
-                content.refresh()
-        except OSError:
-            pass
+    # Trace files are parsed in the thread pool so other clients and timers are not stalled;
+    # only the newest reload is rendered if several overlap.
+    reload_count = 0
+
+    async def reload():
+        nonlocal reload_count
+        reload_count += 1
+        current = reload_count
+        data = await run.io_bound(load_trace_data, trace_file)
+        if data is not None and current == reload_count:
+            content.refresh(data)
+
+    # Re-render whenever the shared watcher reports a change to the trace file
+    unsubscribe_refresh = get_trace_watcher(trace_file).subscribe(
+        lambda: background_tasks.create(reload(), name="reload trace data")
+    )
+    ui.context.client.on_delete(unsubscribe_refresh)
 
     # --- INIT ---
-    ui.timer(1.0, check_refresh)
-    if os.path.exists(trace_file):
-        last_mtime = os.path.getmtime(trace_file)
-
-    content()
+    content(await run.io_bound(load_trace_data, trace_file) or (None, None, None, None))
 
 
 def main():
     """Entry point for the pypss-board CLI command."""
-    import sys
-
-    if len(sys.argv) > 1:
-        start_board(sys.argv[1])
-    else:
+    if len(sys.argv) < 2:
         print("Usage: pypss-board <trace_file>")
         sys.exit(1)
+    trace_file = sys.argv[1]
 
-
-if __name__ in {"__main__", "__mp_main__"}:
     # Force standard asyncio loop to prevent uvloop crashes in virtualized/headless envs
     os.environ["UVICORN_LOOP"] = "asyncio"
 
-    main()
+    # Register static files
+    docs_dir = os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "..", "docs"))
+    if os.path.exists(docs_dir):
+        app.add_static_files("/static", docs_dir)
+    else:
+        print(f"Warning: Docs directory not found at {docs_dir}. Static files will not be served.")
+
+    @ui.page("/")
+    async def index():
+        await start_board(trace_file)
+
+    async def preload():
+        # Parse the trace file while the server boots so the first page load hits the cache
+        await run.io_bound(load_trace_data, trace_file)
+
+    app.on_startup(preload)
 
     ui.run(
         title=GLOBAL_CONFIG.ui_title,
@@ -1557,3 +1774,7 @@ if __name__ in {"__main__", "__mp_main__"}:
         favicon="📊",
         show=False,
     )
+
+
+if __name__ in {"__main__", "__mp_main__"}:
+    main()
@@ -1,9 +1,132 @@
+import functools
+import warnings
 from datetime import datetime
+from typing import Any, Dict, List
 
+import numpy as np
 import pandas as pd
 import plotly.express as px  # type: ignore
 import plotly.graph_objects as go  # type: ignore
 
+from pypss.board.data_loader import format_clock_times
+
+# Upper bound on points sent to the browser per series
+MAX_PLOT_POINTS = 2000
+
+# Data traces built from already-clean NumPy arrays skip Plotly's per-property validation,
+# which otherwise copies and checks every array. Layouts are still validated so shorthand
+# properties keep being normalized into the form plotly.js expects.
+TRACE_OPTS: Dict[str, Any] = {"_validate": False}
+
+# Series longer than this are drawn with WebGL (scattergl) instead of SVG
+WEBGL_MIN_POINTS = 1000
+
+# Plotly keeps user interaction state (zoom, pan, hidden traces) while a figure's uirevision is unchanged
+METRICS_UIREVISION = "pypss-metrics"
+
+
+def scatter_trace(n_points: int, **kwargs):
+    """Scatter trace for `n_points` points: SVG for short series, WebGL once SVG starts to lag."""
+    trace_cls = go.Scattergl if n_points > WEBGL_MIN_POINTS else go.Scatter
+    return trace_cls(**kwargs, **TRACE_OPTS)
+
+
+def figure_data(fig) -> Dict[str, Any]:
+    """
+    Converts a figure to the plain {data, layout} dict ui.plotly sends to the browser.
+    Doing this once when a figure is built (and caching the dict) avoids converting the
+    same go.Figure again for every client that renders it.
+    """
+    if isinstance(fig, go.Figure):
+        return fig.to_plotly_json()
+    return fig
+
+
+def trace_frame(traces) -> pd.DataFrame:
+    """
+    Traces as a DataFrame. A frame that was already built (TraceProcessor.frame) is used as-is,
+    so builders must not modify it; a list of trace dicts is converted.
+    """
+    if isinstance(traces, pd.DataFrame):
+        return traces
+    return pd.DataFrame(traces)
+
+
+def downsample_indices(y, n_out: int = MAX_PLOT_POINTS) -> np.ndarray:
+    """
+    Min/max bucket downsampling: splits the series into n_out // 2 buckets and keeps each
+    bucket's minimum and maximum (plus the endpoints), so spikes survive. Returns sorted positions.
+    """
+    values = np.asarray(y, dtype=np.float64)
+    n = len(values)
+    if n <= n_out:
+        return np.arange(n)
+
+    n_buckets = max(1, n_out // 2)
+    size = -(-n // n_buckets)  # ceil division
+    padded = np.full(n_buckets * size, np.nan)
+    padded[:n] = values
+    rows = padded.reshape(n_buckets, size)
+    nan = np.isnan(rows)
+    mins = np.where(nan, np.inf, rows).argmin(axis=1)
+    maxs = np.where(nan, -np.inf, rows).argmax(axis=1)
+    offsets = np.arange(n_buckets) * size
+    idx = np.concatenate([offsets + mins, offsets + maxs, [0, n - 1]])
+    return np.unique(idx[idx < n])
+
+
+def distribution_sample(values, n_out: int = MAX_PLOT_POINTS) -> np.ndarray:
+    """Evenly spaced order statistics of `values` (min and max included), preserving its distribution shape."""
+    arr = np.sort(np.asarray(values, dtype=np.float64))
+    arr = arr[~np.isnan(arr)]
+    if len(arr) <= n_out:
+        return arr
+    return arr[np.linspace(0, len(arr) - 1, n_out).astype(int)]
+
+
+# Time bins used by the error/branching density heatmaps
+HEATMAP_TIME_BINS = 30
+
+
+def density_heatmap(timestamps, modules, title: str, colorscale: str):
+    """
+    Time x module density heatmap, binned server-side into HEATMAP_TIME_BINS equal-width time bins,
+    so the browser receives a (modules x bins) count grid instead of every event.
+    """
+    ts = np.asarray(timestamps, dtype=np.float64)
+    codes, labels = pd.factorize(np.asarray(modules))
+    # Events without a module or timestamp are left out, as a Plotly histogram would;
+    # factorize gives missing modules code -1, which np.add.at would count in the last row
+    valid = (codes >= 0) & ~np.isnan(ts)
+    ts, codes = ts[valid], codes[valid]
+    lo, hi = (ts.min(), ts.max()) if ts.size else (0.0, 0.0)
+    if lo == hi:
+        edges = np.array([lo - 0.5, hi + 0.5])
+    else:
+        edges = np.linspace(lo, hi, HEATMAP_TIME_BINS + 1)
+    bins = np.clip(np.searchsorted(edges, ts, side="right") - 1, 0, len(edges) - 2)
+    counts = np.zeros((len(labels), len(edges) - 1), dtype=np.int64)
+    np.add.at(counts, (codes, bins), 1)
+    centers = pd.to_datetime((edges[:-1] + edges[1:]) / 2, unit="s")
+
+    fig = go.Figure(
+        go.Heatmap(
+            x=centers,
+            y=list(labels),
+            z=counts,
+            coloraxis="coloraxis",
+            hovertemplate="datetime=%{x}<br>module=%{y}<br>count=%{z}<extra></extra>",
+            **TRACE_OPTS,
+        )
+    )
+    fig.update_layout(
+        title=title,
+        xaxis_title="datetime",
+        yaxis_title="module",
+        coloraxis=dict(colorscale=colorscale, colorbar=dict(title="count")),
+    )
+    return fig
+
 
 def create_stability_sunburst(df):
     if df.empty:
@@ -40,47 +163,59 @@ def create_stability_sunburst(df):
     return fig
 
 
-def create_trend_chart(traces):
-    if not traces:
-        return go.Figure()
+# Latency percentiles drawn by the trend chart
+TREND_PERCENTILES = (0.50, 0.90, 0.99)
+
+
+def _quantile_bin_starts(n: int, num_bins: int) -> np.ndarray:
+    """
+    Start positions of the bins pd.qcut(range(n), num_bins) assigns: edges at the quantiles of
+    0..n-1, intervals closed on the right (the first one also holds 0). Every bin is non-empty
+    for num_bins <= n, so the bins are consecutive slices of the positions.
+    """
+    edges = np.quantile(np.arange(n), np.linspace(0, 1, num_bins + 1))
+    return np.concatenate(([0], np.floor(edges[1:-1]).astype(np.intp) + 1))
+
 
-    df = pd.DataFrame(traces)
+def _binned_percentiles(values: np.ndarray, bin_starts: np.ndarray, percentiles) -> Dict[float, np.ndarray]:
+    """
+    Percentiles of each bin (a slice starting at the given positions), as {percentile: per-bin values}.
+    np.quantile selects with a partition per bin instead of sorting it; NaNs are skipped like pandas does.
+    """
+    quantile = np.nanquantile if np.isnan(values).any() else np.quantile
+    with warnings.catch_warnings():
+        warnings.simplefilter("ignore", RuntimeWarning)  # all-NaN bin: NaN, as pandas returns
+        per_bin = np.array([quantile(chunk, percentiles) for chunk in np.split(values, bin_starts[1:])])
+    return {p: per_bin[:, i] for i, p in enumerate(percentiles)}
+
+
+def create_trend_chart(traces):
+    df = trace_frame(traces)
 
     # Ensure we have data to plot
     if "duration" not in df.columns or df.empty:
         return go.Figure()
 
-    # Sort by timestamp if available, else use index
-    if "timestamp" in df.columns:
-        df = df.sort_values("timestamp")
-
     # Create bins for trend analysis (compress noise)
     # Target ~20-30 data points for the trend line
     num_bins = min(30, len(df))
     if num_bins < 2:
         return go.Figure()
 
-    # Use index-based binning to ensure equal data distribution or time-based?
-    # Index-based is safer for simulations that run very fast.
-    df["bin"] = pd.qcut(df.index, q=num_bins, duplicates="drop")
-
-    # Aggregate stats per bin
-    grouped = (
-        df.groupby("bin", observed=False)["duration"]
-        .quantile([0.50, 0.90, 0.99])  # type: ignore
-        .unstack()
-    )
+    # Index-based binning (equal-count chunks in trace order) is safer for simulations that run very fast
+    bin_starts = _quantile_bin_starts(len(df), num_bins)
+    grouped = _binned_percentiles(df["duration"].to_numpy(dtype=np.float64), bin_starts, TREND_PERCENTILES)
 
     # Create x-axis points (just use bin number 0..N)
-    x_axis = list(range(len(grouped)))
+    x_axis = list(range(len(bin_starts)))
 
     # Calculate time labels if timestamp exists
     tick_vals = x_axis
     tick_text = None
     last_update_str = ""
     if "timestamp" in df.columns:
-        grouped_time = df.groupby("bin", observed=False)["timestamp"].min()
-        tick_text = [datetime.fromtimestamp(ts).strftime("%H:%M:%S") for ts in grouped_time]
+        grouped_time = np.fmin.reduceat(df["timestamp"].to_numpy(dtype=np.float64), bin_starts)
+        tick_text = format_clock_times(grouped_time)
 
         # Latest timestamp for title
         max_ts = df["timestamp"].max()
@@ -93,13 +228,8 @@ def create_trend_chart(traces):
         if len(tick_text) > 10:
             # Keep first, last, and every Nth in between
             step = len(tick_text) // 6
-            final_vals = []
-            final_text = []
-            for i in range(0, len(tick_text), step):
-                final_vals.append(tick_vals[i])
-                final_text.append(tick_text[i])
-            tick_vals = final_vals
-            tick_text = final_text
+            tick_vals = tick_vals[::step]
+            tick_text = tick_text[::step]
 
     font_color = "#333333"
     grid_color = "#e0e0e0"
@@ -210,6 +340,62 @@ def create_gauge_chart(score, title: str = "Stability Score"):
     return fig
 
 
+@functools.lru_cache(maxsize=8)
+def _gauge_template(title: str) -> Dict[str, Any]:
+    return create_gauge_chart(0, title).to_plotly_json()
+
+
+def gauge_chart_data(score, title: str = "Stability Score") -> Dict[str, Any]:
+    """
+    Same chart as create_gauge_chart, as a plain figure dict. The styled figure is built once
+    per title and only the value is swapped in. Treat the result as read-only.
+    """
+    template = _gauge_template(title)
+    return {"data": [{**template["data"][0], "value": score}], "layout": template["layout"]}
+
+
+def _historical_series(history_data) -> Dict[str, List[Any]]:
+    return {
+        "dates": [datetime.fromtimestamp(h["timestamp"]) for h in history_data],
+        "pss": [h["pss"] for h in history_data],
+        "ts": [h.get("ts", 0) * 100 for h in history_data],
+        "ms": [h.get("ms", 0) * 100 for h in history_data],
+        "ev": [h.get("ev", 0) * 100 for h in history_data],
+        "be": [h.get("be", 0) * 100 for h in history_data],
+        "cc": [h.get("cc", 0) * 100 for h in history_data],
+    }
+
+
+@functools.lru_cache(maxsize=1)
+def _historical_template() -> Dict[str, Any]:
+    return create_historical_chart([{"timestamp": 0, "pss": 0}]).to_plotly_json()
+
+
+@functools.lru_cache(maxsize=1)
+def _empty_historical_figure() -> Dict[str, Any]:
+    return create_historical_chart([]).to_plotly_json()
+
+
+def historical_chart_data(history_data) -> Dict[str, Any]:
+    """
+    Same chart as create_historical_chart, as a plain figure dict. Layout and trace styling
+    come from a figure built once; only the data arrays are filled in. Treat the result as read-only.
+    """
+    if not history_data:
+        return _empty_historical_figure()
+
+    series = _historical_series(history_data)
+    custom_data = list(zip(series["ts"], series["ms"], series["ev"], series["be"], series["cc"], strict=True))
+    pss_trace, ts_trace, ms_trace, ev_trace = _historical_template()["data"]
+    data = [
+        {**pss_trace, "x": series["dates"], "y": series["pss"], "customdata": custom_data},
+        {**ts_trace, "x": series["dates"], "y": series["ts"]},
+        {**ms_trace, "x": series["dates"], "y": series["ms"]},
+        {**ev_trace, "x": series["dates"], "y": series["ev"]},
+    ]
+    return {"data": data, "layout": _historical_template()["layout"]}
+
+
 def create_historical_chart(history_data):
     if not history_data:
         fig = go.Figure()
@@ -232,13 +418,14 @@ def create_historical_chart(history_data):
         return fig
 
     # Extract data
-    dates = [datetime.fromtimestamp(h["timestamp"]) for h in history_data]
-    pss_scores = [h["pss"] for h in history_data]
-    ts_scores = [h.get("ts", 0) * 100 for h in history_data]
-    ms_scores = [h.get("ms", 0) * 100 for h in history_data]
-    ev_scores = [h.get("ev", 0) * 100 for h in history_data]
-    be_scores = [h.get("be", 0) * 100 for h in history_data]
-    cc_scores = [h.get("cc", 0) * 100 for h in history_data]
+    series = _historical_series(history_data)
+    dates = series["dates"]
+    pss_scores = series["pss"]
+    ts_scores = series["ts"]
+    ms_scores = series["ms"]
+    ev_scores = series["ev"]
+    be_scores = series["be"]
+    cc_scores = series["cc"]
 
     # Prepare custom data for tooltips (all sub-scores)
     custom_data = []
@@ -374,11 +561,13 @@ def plot_stability_trends(df: pd.DataFrame):
 
         # Determine if we need to scale (PSS is already 0-100, others are 0-1)
         y_vals = df[col] if col == "pss" else df[col] * 100
+        keep = downsample_indices(y_vals.to_numpy())
 
         fig.add_trace(
-            go.Scatter(
-                x=df.index,
-                y=y_vals,
+            scatter_trace(
+                len(keep),
+                x=df.index[keep],
+                y=y_vals.to_numpy()[keep],
                 mode="lines+markers",
                 name=style["name"],
                 line=dict(color=style["color"], width=style["width"], dash=style["dash"]),
@@ -400,6 +589,8 @@ def plot_stability_trends(df: pd.DataFrame):
         yaxis=dict(range=[0, 105], gridcolor=grid_color),
         xaxis=dict(gridcolor=grid_color),
         legend=dict(orientation="h", yanchor="bottom", y=1.02, xanchor="right", x=1),
+        # Constant across window changes, so Plotly.react keeps the user's zoom, pan and legend toggles
+        uirevision=METRICS_UIREVISION,
     )
 
     return fig
@@ -409,19 +600,15 @@ def plot_error_heatmap(traces: list):
     """
     Heatmap of Error Density: Time vs Module.
     """
-    if not traces:
-        return go.Figure()
-
-    df = pd.DataFrame(traces)
+    df = trace_frame(traces)
     # Robustly check columns exist
-    if "error" not in df.columns or "module" not in df.columns:
+    if df.empty or "error" not in df.columns or "module" not in df.columns:
         return go.Figure()
 
     # Ensure error is boolean and handle filtering safely
     try:
         # Fill NAs with False to avoid errors during filtering
-        df["error"] = df["error"].fillna(False).astype(bool)
-        errors = df[df["error"]].copy()
+        errors = df[df["error"].fillna(False).astype(bool)].copy()
     except Exception:
         return go.Figure()
 
@@ -438,21 +625,12 @@ def plot_error_heatmap(traces: list):
         )
         return fig
 
-    if "timestamp" in errors.columns:
-        errors["datetime"] = pd.to_datetime(errors["timestamp"], unit="s")
-    else:
+    if "timestamp" not in errors.columns:
         # Fallback if no timestamp
         return go.Figure()
 
     # Use Density Heatmap
-    fig = px.density_heatmap(
-        errors,
-        x="datetime",
-        y="module",
-        nbinsx=30,  # Auto-binning
-        title="Error Cluster Heatmap",
-        color_continuous_scale="Reds",
-    )
+    fig = density_heatmap(errors["timestamp"], errors["module"], "Error Cluster Heatmap", "Reds")
 
     font_color = "#333333"
     fig.update_layout(
@@ -469,11 +647,8 @@ def plot_entropy_heatmap(traces: list):
     Heatmap of Branching Activity/Entropy: Time vs Module.
     Uses 'branch_tag' presence as a proxy for complex logic density.
     """
-    if not traces:
-        return go.Figure()
-
-    df = pd.DataFrame(traces)
-    if "branch_tag" not in df.columns or "module" not in df.columns:
+    df = trace_frame(traces)
+    if df.empty or "branch_tag" not in df.columns or "module" not in df.columns:
         return go.Figure()
 
     # Filter traces with branch tags
@@ -481,21 +656,16 @@ def plot_entropy_heatmap(traces: list):
     if branches.empty:
         return go.Figure()
 
-    if "timestamp" in branches.columns:
-        branches["datetime"] = pd.to_datetime(branches["timestamp"], unit="s")
+    if "timestamp" not in branches.columns:
+        return go.Figure()
 
     # We want to show 'Entropy' or 'Complexity'.
     # Simply counting branch tags in a bin gives 'Branch Density'.
     # Calculating actual entropy requires aggregation.
     # For visual simplicity in a heatmap, Density of Branching Events is a good proxy for "Hot/Complex Paths".
 
-    fig = px.density_heatmap(
-        branches,
-        x="datetime",
-        y="module",
-        nbinsx=30,
-        title="Branching Activity Heatmap (Complexity Proxy)",
-        color_continuous_scale="Viridis",
+    fig = density_heatmap(
+        branches["timestamp"], branches["module"], "Branching Activity Heatmap (Complexity Proxy)", "Viridis"
     )
 
     font_color = "#333333"
@@ -512,16 +682,19 @@ def plot_concurrency_dist(traces: list):
     """
     Distribution of CPU Time vs Wait Time (Violin Plot).
     """
-    if not traces:
-        return go.Figure()
-
-    df = pd.DataFrame(traces)
+    df = trace_frame(traces)
     required_cols = ["cpu_time", "wait_time"]
-    if not all(col in df.columns for col in required_cols):
+    if df.empty or not all(col in df.columns for col in required_cols):
         return go.Figure()
 
-    # Melt for side-by-side violin
-    melted = df.melt(value_vars=["cpu_time", "wait_time"], var_name="Metric", value_name="Seconds")
+    # Melt for side-by-side violin; large runs are reduced to evenly spaced quantiles first
+    samples = {col: distribution_sample(pd.to_numeric(df[col], errors="coerce")) for col in required_cols}
+    melted = pd.DataFrame(
+        {
+            "Metric": np.repeat(required_cols, [len(v) for v in samples.values()]),
+            "Seconds": np.concatenate(list(samples.values())),
+        }
+    )
 
     fig = px.violin(
         melted,
@@ -550,11 +723,10 @@ def create_custom_chart(traces: list, config: dict):
     Creates a custom chart based on user config.
     Config keys: x_axis, y_axis, chart_type, aggregation (optional), title
     """
-    if not traces:
+    df = trace_frame(traces)
+    if df.empty:
         return go.Figure()
 
-    df = pd.DataFrame(traces)
-
     x_col = config.get("x_axis", "timestamp")
     y_col = config.get("y_axis", "duration")
     chart_type = config.get("chart_type", "line")
@@ -563,6 +735,9 @@ def create_custom_chart(traces: list, config: dict):
     if x_col not in df.columns or y_col not in df.columns:
         return go.Figure(layout=dict(title=f"Error: Columns {x_col}/{y_col} not found"))
 
+    # Work on a copy of just the plotted columns; the input frame may be shared
+    df = df[list(dict.fromkeys((x_col, y_col)))].copy()
+
     if x_col == "timestamp":
         df["datetime"] = pd.to_datetime(df["timestamp"], unit="s")
         x_col = "datetime"
@@ -578,14 +753,19 @@ def create_custom_chart(traces: list, config: dict):
         except Exception:
             pass  # Fallback to raw
 
+    # Raw (unaggregated) line/scatter series are downsampled before serialization
+    if chart_type in ("line", "scatter") and pd.api.types.is_numeric_dtype(df[y_col]):
+        df = df.iloc[downsample_indices(df[y_col].to_numpy())]
+
     fig = go.Figure()
 
+    x, y = df[x_col].to_numpy(), df[y_col].to_numpy()
     if chart_type == "line":
-        fig.add_trace(go.Scatter(x=df[x_col], y=df[y_col], mode="lines", name=y_col))
+        fig.add_trace(scatter_trace(len(df), x=x, y=y, mode="lines", name=y_col))
     elif chart_type == "scatter":
-        fig.add_trace(go.Scatter(x=df[x_col], y=df[y_col], mode="markers", name=y_col))
+        fig.add_trace(scatter_trace(len(df), x=x, y=y, mode="markers", name=y_col))
     elif chart_type == "bar":
-        fig.add_trace(go.Bar(x=df[x_col], y=df[y_col], name=y_col))
+        fig.add_trace(go.Bar(x=x, y=y, name=y_col, **TRACE_OPTS))
 
     fig.update_layout(
         title=title,
@@ -1,13 +1,76 @@
+import dataclasses
+import functools
 import json
-import math
-from typing import Dict, List
-
+import os
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
 import pandas as pd
 
+try:
+    import orjson
+
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
 from ..cli.discovery import get_module_score_breakdown
 from ..core import compute_pss_from_traces
-from ..utils.config import GLOBAL_CONFIG
-from ..utils.utils import calculate_entropy
+from ..utils.config import GLOBAL_CONFIG, PSSConfig
+
+
+@dataclass
+class TraceColumns:
+    """
+    Column-oriented (structure-of-arrays) view of the raw traces, in file order.
+    Row i of every array describes raw_traces[i].
+    """
+
+    timestamp: np.ndarray
+    duration: np.ndarray
+    module: np.ndarray
+    name: np.ndarray
+    error: np.ndarray
+    exception_type: np.ndarray
+    exception_message: np.ndarray
+
+    def __len__(self) -> int:
+        return len(self.timestamp)
+
+    @classmethod
+    def from_frame(cls, df: pd.DataFrame) -> "TraceColumns":
+        def column(name: str, default: Any, dtype: Any) -> np.ndarray:
+            if name not in df.columns:
+                return np.full(len(df), default, dtype=dtype)
+            return df[name].fillna(default).to_numpy(dtype=dtype)
+
+        return cls(
+            timestamp=column("timestamp", 0.0, np.float64),
+            duration=column("duration", 0.0, np.float64),
+            module=column("module", "unknown", object),
+            name=column("name", "unknown", object),
+            error=column("error", False, bool),
+            exception_type=column("exception_type", "N/A", object),
+            exception_message=column("exception_message", "N/A", object),
+        )
+
+    @functools.cached_property
+    def module_groups(self) -> Dict[Any, np.ndarray]:
+        """Positions of each module's traces (file order), bucketed in a single pass."""
+        codes, modules = pd.factorize(self.module)
+        if len(modules) == 0:
+            return {}
+        order = np.argsort(codes, kind="stable")
+        bounds = np.cumsum(np.bincount(codes, minlength=len(modules)))[:-1]
+        return dict(zip(modules, np.split(order, bounds), strict=True))
+
+    def module_indices(self, module: str) -> np.ndarray:
+        """Positions of the traces belonging to `module`."""
+        return self.module_groups.get(module, np.empty(0, dtype=np.intp))
 
 
 class TraceProcessor:
@@ -17,78 +80,156 @@ class TraceProcessor:
 
     def __init__(self, traces: List[Dict]):
         self.traces = traces
+        self._kpis: Optional[Dict[str, Any]] = None
+        self._timeseries_cache: Dict[Tuple[Any, ...], pd.DataFrame] = {}
+        self._module_reports: Dict[str, Dict[str, Any]] = {}
+        self._failed_frames: Dict[Optional[str], pd.DataFrame] = {}
         if not traces:
             self.df = pd.DataFrame()
+            self.frame = self.df
+            self.columns = TraceColumns.from_frame(self.df)
             return
 
-        self.df = pd.DataFrame(traces)
+        # Built once per load and shared read-only with the chart builders (file order)
+        self.frame = pd.DataFrame(traces)
+        self.df = self.frame
+        self.columns = TraceColumns.from_frame(self.frame)
 
-        if "timestamp" in self.df.columns:
-            self.df["datetime"] = pd.to_datetime(self.df["timestamp"], unit="s")
+        if "timestamp" in self.frame.columns:
+            # Time-indexed copy for resampling; `frame` itself is never modified
+            self.df = self.frame.assign(datetime=pd.to_datetime(self.frame["timestamp"], unit="s"))
             self.df = self.df.set_index("datetime").sort_index()
 
+    def get_kpis(self) -> Dict[str, Any]:
+        """
+        Headline KPIs (totals, latency and error aggregates) for the loaded traces.
+        Computed once per processor and shared by all KPI widgets.
+        """
+        if self._kpis is None:
+            cols = self.columns
+            self._kpis = compute_kpis(cols.duration, cols.error)
+        return self._kpis
+
+    def precompute(self):
+        """
+        Builds the memoized views every render uses (KPIs, module buckets). Called by the loader,
+        which runs on a worker thread, so the first render does not compute them on the event loop.
+        """
+        self.get_kpis()
+        _ = self.columns.module_groups
+
+    def get_module_traces(self, module: str) -> List[Dict]:
+        """Raw traces belonging to `module`, in file order."""
+        return [self.traces[i] for i in self.columns.module_indices(module)]
+
+    def get_module_frame(self, module: str) -> pd.DataFrame:
+        """Rows of `frame` belonging to `module`, in file order (a copy; the shared frame is untouched)."""
+        return self.frame.take(self.columns.module_indices(module))
+
+    def get_module_report(self, module: str) -> Dict[str, Any]:
+        """
+        PSS report for one module's traces, computed once per processor (i.e. per load),
+        so reopening a module's detail view does not recompute it.
+        """
+        report = self._module_reports.get(module)
+        if report is None:
+            report = self._module_reports[module] = compute_pss_cached(self.get_module_traces(module))
+        return report
+
+    def get_failed_frame(self, module: Optional[str] = None) -> pd.DataFrame:
+        """
+        Failed traces (optionally restricted to one module) as a table frame with raw values,
+        ready for `table_page(..., formatters=FAILED_ROW_FORMATTERS)`. Built column-wise once
+        per processor; `index` points back into `columns`/`traces` for the full error message.
+        """
+        frame = self._failed_frames.get(module)
+        if frame is None:
+            cols = self.columns
+            if module is None:
+                idx = np.flatnonzero(cols.error)
+            else:
+                idx = cols.module_indices(module)
+                idx = idx[cols.error[idx]]
+            frame = self._failed_frames[module] = pd.DataFrame(
+                {
+                    "time": cols.timestamp[idx],
+                    "module": cols.module[idx],
+                    "function": cols.name[idx],
+                    "error_type": cols.exception_type[idx],
+                    "error_message": cols.exception_message[idx],
+                    "duration": cols.duration[idx],
+                    "index": idx,
+                }
+            )
+        return frame
+
+    def timeseries_key(self, window_size: str = "1min") -> Tuple[Any, ...]:
+        """Cache key for get_metric_timeseries: the window plus every config value the scores depend on."""
+        return (
+            window_size,
+            GLOBAL_CONFIG.alpha,
+            GLOBAL_CONFIG.gamma,
+            GLOBAL_CONFIG.advisor_entropy_threshold,
+            GLOBAL_CONFIG.concurrency_wait_threshold,
+            GLOBAL_CONFIG.w_ts,
+            GLOBAL_CONFIG.w_ms,
+            GLOBAL_CONFIG.w_ev,
+            GLOBAL_CONFIG.w_be,
+            GLOBAL_CONFIG.w_cc,
+        )
+
     def get_metric_timeseries(self, window_size: str = "1min") -> pd.DataFrame:
         """
         Aggregates metrics into time buckets (TS, MS, EV, BE, CC, PSS).
+        Results are memoized per window and scoring config; treat them as read-only.
         """
+        key = self.timeseries_key(window_size)
+        cached = self._timeseries_cache.get(key)
+        if cached is None:
+            cached = self._timeseries_cache[key] = self._compute_metric_timeseries(window_size)
+        return cached
+
+    def _compute_metric_timeseries(self, window_size: str) -> pd.DataFrame:
         if self.df.empty:
             return pd.DataFrame()
 
+        # Per-window scores from built-in resample reductions (size/mean/std/sum) computed column-wise,
+        # instead of calling a Python scoring function for every window and column.
+        # Windows without samples score 1.0.
         resampler = self.df.resample(window_size)
-
-        def calc_ts_score(durations):
-            if len(durations) < 2:
-                return 1.0
-            mean = durations.mean()
-            if mean == 0:
-                return 1.0
-            cv = durations.std() / mean
-            return math.exp(-GLOBAL_CONFIG.alpha * cv)
-
-        def calc_ms_score(mem_diffs):
-            if len(mem_diffs) == 0:
-                return 1.0
-            mean_diff_mb = abs(mem_diffs.mean()) / (1024 * 1024)
-            return math.exp(-GLOBAL_CONFIG.gamma * mean_diff_mb)
-
-        def calc_ev_score(errors):
-            if len(errors) == 0:
-                return 1.0
-            error_rate = errors.sum() / len(errors)
-            return max(0.0, 1.0 - (error_rate * 5.0))
-
-        def calc_be_score(tags):
-            if len(tags) == 0:
-                return 1.0
-            ent = calculate_entropy(tags.dropna().tolist())
-            return max(0.0, 1.0 - (ent / GLOBAL_CONFIG.advisor_entropy_threshold))
-
-        def calc_cc_score(wait_times):
-            if len(wait_times) == 0:
-                return 1.0
-            mean_wait = wait_times.mean()
-            return math.exp(-mean_wait / (GLOBAL_CONFIG.concurrency_wait_threshold * 10))
-
-        agg_funcs = {
-            "duration": calc_ts_score,
-            "memory_diff": calc_ms_score,
-            "error": calc_ev_score,
-            "branch_tag": calc_be_score,
-            "wait_time": calc_cc_score,
-        }
-
-        valid_funcs = {k: v for k, v in agg_funcs.items() if k in self.df.columns}
-
-        scores_df = resampler.agg(valid_funcs)  # type: ignore[arg-type]
-
-        col_map = {
-            "duration": "ts",
-            "memory_diff": "ms",
-            "error": "ev",
-            "branch_tag": "be",
-            "wait_time": "cc",
-        }
-        scores_df = scores_df.rename(columns=col_map)
+        sizes = resampler.size()
+        has_rows = sizes > 0
+        scores_df = pd.DataFrame(index=sizes.index)
+
+        if "duration" in self.df.columns:
+            mean = resampler["duration"].mean()
+            cv = resampler["duration"].std() / mean
+            ts = np.exp(-GLOBAL_CONFIG.alpha * cv)
+            scores_df["ts"] = ts.where((sizes >= 2) & (mean != 0), 1.0)
+
+        if "memory_diff" in self.df.columns:
+            mean_diff_mb = resampler["memory_diff"].mean().abs() / (1024 * 1024)
+            scores_df["ms"] = np.exp(-GLOBAL_CONFIG.gamma * mean_diff_mb).where(has_rows, 1.0)
+
+        if "error" in self.df.columns:
+            errors = self.df["error"].astype(float).resample(window_size).sum()
+            scores_df["ev"] = (1.0 - (errors / sizes) * 5.0).clip(lower=0.0).where(has_rows, 1.0)
+
+        if "branch_tag" in self.df.columns:
+            tags = self.df["branch_tag"].dropna()
+            entropy = pd.Series(0.0, index=sizes.index)
+            if not tags.empty:
+                counts = tags.groupby([pd.Grouper(freq=window_size), tags]).size()
+                probabilities = counts / counts.groupby(level=0).transform("sum")
+                entropy = (-(probabilities * np.log2(probabilities))).groupby(level=0).sum()
+                entropy = entropy.reindex(sizes.index, fill_value=0.0)
+            be = (1.0 - entropy / GLOBAL_CONFIG.advisor_entropy_threshold).clip(lower=0.0)
+            scores_df["be"] = be.where(has_rows, 1.0)
+
+        if "wait_time" in self.df.columns:
+            mean_wait = resampler["wait_time"].mean()
+            cc = np.exp(-mean_wait / (GLOBAL_CONFIG.concurrency_wait_threshold * 10))
+            scores_df["cc"] = cc.where(has_rows, 1.0)
 
         scores_df = scores_df.fillna(1.0)
 
@@ -103,17 +244,311 @@ class TraceProcessor:
         return scores_df
 
 
+ERROR_PREVIEW_LENGTH = 80
+
+
+def _preview(message: Any) -> str:
+    text = str(message)
+    return text if len(text) <= ERROR_PREVIEW_LENGTH else text[: ERROR_PREVIEW_LENGTH - 1] + "…"
+
+
+def format_error_previews(messages: Sequence[Any]) -> List[str]:
+    """Cuts error messages to ERROR_PREVIEW_LENGTH characters for table cells."""
+    return [_preview(msg) for msg in messages]
+
+
+def compute_kpis(durations: np.ndarray, errors: np.ndarray) -> Dict[str, Any]:
+    """
+    Aggregates the headline latency and error KPIs over columnar trace data, one NumPy reduction each.
+    """
+    n = len(durations)
+    if n == 0:
+        return {"total": 0, "duration_mean": 0.0, "error_count": 0, "error_rate": 0.0}
+
+    error_count = int(np.count_nonzero(errors))
+    return {
+        "total": n,
+        "duration_mean": float(durations.sum()) / n,
+        "error_count": error_count,
+        "error_rate": error_count / n,
+    }
+
+
+def format_clock_times(timestamps: Sequence[float]) -> List[str]:
+    """
+    Formats epoch seconds as local-time HH:MM:SS strings in a single vectorized pass.
+    """
+    if len(timestamps) == 0:
+        return []
+    seconds = np.floor(np.asarray(timestamps, dtype=np.float64)).astype(np.int64)
+    # UTC offsets only change on quarter-hour boundaries, so resolve them once per distinct quarter hour
+    # (a handful of localtime calls) instead of converting every timestamp through the tz database.
+    quarters, inverse = np.unique(seconds // 900, return_inverse=True)
+    offsets = np.array([time.localtime(q * 900).tm_gmtoff for q in quarters.tolist()], dtype=np.int64)
+    clock = (seconds + offsets[inverse.ravel()]) % 86400
+    return [f"{s // 3600:02d}:{s // 60 % 60:02d}:{s % 60:02d}" for s in clock.tolist()]
+
+
+def format_durations_ms(durations: Sequence[float]) -> List[str]:
+    """
+    Formats durations in seconds as millisecond strings (e.g. "12.5ms").
+    """
+    if len(durations) == 0:
+        return []
+    ms = np.asarray(durations, dtype=np.float64) * 1000
+    return np.char.add(np.char.mod("%.1f", ms), "ms").tolist()
+
+
+# Display formatting for the failed-trace tables, applied to the visible page only
+FAILED_ROW_FORMATTERS: Dict[str, Callable[[Sequence[Any]], List[str]]] = {
+    "time": format_clock_times,
+    "error_message": format_error_previews,
+    "duration": format_durations_ms,
+}
+
+
+def table_page(
+    df: pd.DataFrame,
+    pagination: Dict[str, Any],
+    decimals: Sequence[str] = (),
+    formatters: Optional[Dict[str, Callable[[Sequence[Any]], List[str]]]] = None,
+) -> List[Dict[str, Any]]:
+    """
+    Rows for one page of a server-side paginated table (Quasar pagination dict: page,
+    rowsPerPage, sortBy, descending). Sorting uses the raw values; only the rows on the page
+    are converted to records, with `decimals` columns formatted to two places and `formatters`
+    columns passed through their (vectorized) formatter.
+    """
+    sort_by = pagination.get("sortBy")
+    if sort_by in df.columns:
+        df = df.sort_values(sort_by, ascending=not pagination.get("descending", False), kind="stable")
+    rows_per_page = pagination.get("rowsPerPage") or len(df)  # 0 means "all rows"
+    start = (max(1, pagination.get("page") or 1) - 1) * rows_per_page
+    page = df.iloc[start : start + rows_per_page]
+    formatted = {col: page[col].map("{:.2f}".format) for col in decimals if col in page.columns}
+    for col, formatter in (formatters or {}).items():
+        if col in page.columns:
+            formatted[col] = formatter(page[col].to_numpy())
+    page = page.assign(**formatted)
+    # Column-wise tolist() + zip builds the same native-typed records as to_dict("records"), without its
+    # per-row overhead (several times faster on table-sized pages)
+    columns = list(page.columns)
+    rows = zip(*(page[col].tolist() for col in columns), strict=True)
+    return [dict(zip(columns, values, strict=True)) for values in rows]
+
+
+_REPORT_CACHE_SIZE = 32
+# GLOBAL_CONFIG fields that compute_pss_from_traces reads; their values are part of every memoized report key
+SCORING_CONFIG_FIELDS = tuple(
+    f.name
+    for f in dataclasses.fields(PSSConfig)
+    if f.name.startswith(("w_", "score_"))
+    or f.name
+    in (
+        "custom_metric_weights",
+        "alpha",
+        "beta",
+        "gamma",
+        "delta",
+        "mem_spike_threshold_ratio",
+        "error_spike_threshold",
+        "consecutive_error_threshold",
+        "concurrency_wait_threshold",
+        "discovery_unknown_module_name",
+    )
+)
+_report_cache: "OrderedDict[Tuple[Any, ...], Dict[str, Any]]" = OrderedDict()
+
+
+def trace_fingerprint(traces: List[Dict]) -> Tuple[Any, ...]:
+    """
+    Cheap identity for a list of traces: its length plus the first and last trace markers.
+    """
+    if not traces:
+        return (0,)
+    first, last = traces[0], traces[-1]
+    return (
+        len(traces),
+        first.get("timestamp"),
+        first.get("name"),
+        last.get("timestamp"),
+        last.get("name"),
+    )
+
+
+def scoring_config_key() -> Tuple[Any, ...]:
+    """Current values of the scoring settings, so reports memoized under other settings are not reused."""
+    values = (getattr(GLOBAL_CONFIG, name) for name in SCORING_CONFIG_FIELDS)
+    return tuple(tuple(sorted(value.items())) if isinstance(value, dict) else value for value in values)
+
+
+def _trace_digest(traces: List[Dict]) -> int:
+    """
+    Hash over every trace's timestamp, duration and error flag. Linear, but far cheaper than scoring,
+    and unlike trace_fingerprint it tells apart trace sets that only differ between their first and last trace.
+    """
+    return hash(tuple((t.get("timestamp"), t.get("duration"), t.get("error")) for t in traces))
+
+
+def compute_pss_cached(traces: List[Dict]) -> Dict[str, Any]:
+    """
+    Memoized compute_pss_from_traces keyed on the traces' content and the scoring settings (LRU, 32 entries).
+    """
+    key = (scoring_config_key(), trace_fingerprint(traces), _trace_digest(traces))
+    report = _report_cache.get(key)
+    if report is not None:
+        _report_cache.move_to_end(key)
+        return report
+
+    report = compute_pss_from_traces(traces)
+    _report_cache[key] = report
+    if len(_report_cache) > _REPORT_CACHE_SIZE:
+        _report_cache.popitem(last=False)
+    return report
+
+
+def clear_trace_cache():
+    """Drops all memoized trace loads and reports."""
+    _load_trace_data_cached.cache_clear()
+    _report_cache.clear()
+    with _tails_lock:
+        _tails.clear()
+
+
 def load_trace_data(file_path: str):
     """
     Loads traces and returns structured data for the dashboard.
     Returns: (overall_report, module_df, raw_traces, trace_processor)
-    """
+    The processor exposes a columnar view of raw_traces as `trace_processor.columns`.
 
+    Results are memoized on the file's (mtime_ns, size) and the scoring settings, so repeated
+    refreshes of an unchanged trace file skip parsing entirely, while saving new weights or
+    thresholds rescores it. Callers must treat them as read-only.
+    """
     try:
-        with open(file_path, "r") as f:
-            data = json.load(f)
+        st = os.stat(file_path)
+    except OSError:
+        return _load_trace_data(file_path)
+    return _load_trace_data_cached(file_path, st.st_mtime_ns, st.st_size, scoring_config_key())
+
+
+@functools.lru_cache(maxsize=4)
+def _load_trace_data_cached(file_path: str, mtime_ns: int, size: int, config_key: Tuple[Any, ...]):
+    return _load_trace_data(file_path)
+
+
+def _json_loads(data: bytes) -> Any:
+    """Parses JSON with orjson when installed, falling back to the stdlib parser (which also accepts NaN/Infinity)."""
+    if ORJSON_AVAILABLE:
+        try:
+            return orjson.loads(data)
+        except orjson.JSONDecodeError:
+            pass
+    return json.loads(data)
+
 
+@dataclass
+class _TraceTail:
+    """Read position in an append-only JSON Lines trace file and the traces parsed so far."""
+
+    inode: int
+    offset: int
+    marker: bytes  # the bytes just before `offset`, to detect in-place rewrites
+    traces: List[Dict]
+
+
+# JSON Lines file names; a one-line file with one of these is read as one trace, not as a JSON document
+JSON_LINES_EXTENSIONS = (".jsonl", ".ndjson")
+_TAIL_MARKER_SIZE = 64
+_tails: Dict[str, _TraceTail] = {}
+_tails_lock = threading.Lock()
+
+
+def _tail_json_lines(file_path: str, tail: Optional[_TraceTail]) -> Optional[_TraceTail]:
+    """
+    Reads the complete lines appended since `tail`, or the whole file when `tail` is None.
+    Returns None if the file was replaced, truncated or rewritten since `tail`.
+    Lines that are not valid JSON are skipped; a trailing partial line is left for the next read.
+    """
+    with open(file_path, "rb") as f:
+        inode = os.fstat(f.fileno()).st_ino
+        if tail is not None:
+            if tail.inode != inode:
+                return None
+            f.seek(tail.offset - len(tail.marker))
+            if f.read(len(tail.marker)) != tail.marker:
+                return None
+        start = tail.offset if tail is not None else 0
+        f.seek(start)
+        chunk = f.read()
+
+    end = chunk.rfind(b"\n") + 1
+    new_traces = []
+    for line in chunk[:end].splitlines():
+        if line.strip():
+            try:
+                new_traces.append(_json_loads(line))
+            except ValueError:
+                continue
+
+    traces = tail.traces if tail is not None else []
+    if new_traces:
+        # A new list: earlier loads keep sharing the old one read-only
+        traces = traces + new_traces
+    offset = start + end
+    if end:
+        marker = chunk[max(0, end - _TAIL_MARKER_SIZE) : end]
+    else:
+        marker = tail.marker if tail is not None else b""
+    return _TraceTail(inode, offset, marker, traces)
+
+
+def _read_trace_file(file_path: str) -> Any:
+    """
+    Parses a trace file: a JSON document ({"traces": [...]} or a list of traces), or JSON Lines
+    as appended by FileFIFOCollector. JSON Lines files are followed incrementally: after the
+    first load only the bytes appended since the previous read are parsed.
+    Returns None when the file cannot be read or parsed.
+    """
+    with _tails_lock:
+        tail = _tails.pop(file_path, None)
+        if tail is not None:
+            try:
+                tail = _tail_json_lines(file_path, tail)
+            except OSError:
+                return None
+            if tail is not None:
+                _tails[file_path] = tail
+                return tail.traces
+
+    try:
+        with open(file_path, "rb") as f:
+            data = _json_loads(f.read())
+    except json.JSONDecodeError:
+        pass  # not a single JSON document; try JSON Lines
     except Exception:
+        return None
+    else:
+        # A one-line JSON Lines file also parses as a document: a single trace object. The extension
+        # tells the two apart, as an unknown object in a .json file is not a trace.
+        single_trace = isinstance(data, dict) and "traces" not in data
+        if not (single_trace and file_path.lower().endswith(JSON_LINES_EXTENSIONS)):
+            return data
+
+    try:
+        tail = _tail_json_lines(file_path, None)
+    except OSError:
+        return None
+    if tail is None or not tail.traces:
+        return None
+    with _tails_lock:
+        _tails[file_path] = tail
+    return tail.traces
+
+
+def _load_trace_data(file_path: str):
+    data = _read_trace_file(file_path)
+    if data is None:
         return None, None, None, None
 
     if not data:
@@ -132,6 +567,14 @@ def load_trace_data(file_path: str):
 
     module_scores = get_module_score_breakdown(traces)
 
+    processor = TraceProcessor(traces)
+    processor.precompute()
+    # Count each distinct trace name once, then match module names against the distinct names only
+    if "name" in processor.frame.columns:
+        name_counts = processor.frame["name"].fillna("").value_counts().to_dict()
+    else:
+        name_counts = {"": len(traces)}
+
     df_data = []
     for mod, score in module_scores.items():
         df_data.append(
@@ -141,7 +584,7 @@ def load_trace_data(file_path: str):
                 "timing": score["breakdown"]["timing_stability"],
                 "memory": score["breakdown"]["memory_stability"],
                 "errors": score["breakdown"]["error_volatility"],
-                "traces": len([t for t in traces if mod in t.get("name", "")]),
+                "traces": sum(count for name, count in name_counts.items() if mod in name),
             }
         )
 
@@ -149,6 +592,4 @@ def load_trace_data(file_path: str):
     if not module_df.empty:
         module_df = module_df.sort_values(by="pss", ascending=True).reset_index(drop=True)
 
-    processor = TraceProcessor(traces)
-
     return overall_report, module_df, traces, processor
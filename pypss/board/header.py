@@ -0,0 +1,113 @@
+import os
+import time
+from datetime import datetime, tzinfo
+from typing import Callable, Dict, Optional
+
+from nicegui import app
+from nicegui.binding import BindableProperty
+
+
+class HeaderState:
+    """
+    Process-wide live values for the dashboard header (clock and data freshness).
+    A single app-level timer refreshes them; every client binds its labels to this object,
+    so the values are computed once per tick instead of once per connected client.
+    """
+
+    clock = BindableProperty()
+
+    def __init__(self):
+        self.clock = ""
+        self._files: Dict[str, "TraceFileState"] = {}
+        self._tz: Optional[tzinfo] = None
+        self._tz_hour = -1
+        self._viewers = 0
+
+    def watch(self, trace_file: str) -> "TraceFileState":
+        if trace_file not in self._files:
+            state = self._files[trace_file] = TraceFileState(trace_file)
+            state.update(time.time())
+        return self._files[trace_file]
+
+    def attach(self) -> Callable[[], None]:
+        """
+        Registers a page showing the header and returns the function that detaches it.
+        The shared timer does no work while no page is attached.
+        """
+        self._viewers += 1
+        if self._viewers == 1:
+            self.tick()  # values may be stale after an idle period
+        detached = False
+
+        def detach():
+            nonlocal detached
+            if not detached:
+                detached = True
+                self._viewers -= 1
+
+        return detach
+
+    def _on_timer(self):
+        if self._viewers:
+            self.tick()
+
+    def tick(self):
+        # All header values are assigned in this one synchronous pass, so NiceGUI's outbox
+        # ships the clock and freshness labels to each client in a single update message.
+        now = time.time()
+        # Resolve the local timezone once an hour (picks up DST changes) instead of every tick
+        hour = int(now // 3600)
+        if hour != self._tz_hour:
+            self._tz_hour = hour
+            try:
+                self._tz = datetime.now().astimezone().tzinfo
+            except Exception:
+                self._tz = None
+        if self._tz is not None:
+            clock = datetime.fromtimestamp(now, self._tz).strftime("%Y-%m-%d %H:%M:%S %Z")
+        else:
+            clock = datetime.fromtimestamp(now).strftime("%Y-%m-%d %H:%M:%S")
+        if clock != self.clock:
+            self.clock = clock
+        for state in self._files.values():
+            state.update(now)
+
+
+class TraceFileState:
+    """Freshness of one trace file, as shown in the header."""
+
+    freshness = BindableProperty()
+
+    def __init__(self, path: str):
+        self.path = path
+        self.freshness = "Data: --"
+
+    def update(self, now: float):
+        try:
+            mtime = os.path.getmtime(self.path)
+        except OSError:
+            freshness = "Data: Pending"
+        else:
+            age = now - mtime
+            if age < 60:
+                freshness = f"Data: {int(age)}s ago"
+            elif age < 3600:
+                freshness = f"Data: {int(age / 60)}m ago"
+            else:
+                freshness = f"Data: {int(age / 3600)}h ago"
+        # Bound labels are only notified when the text actually changes
+        if freshness != self.freshness:
+            self.freshness = freshness
+
+
+_header_state: Optional[HeaderState] = None
+
+
+def get_header_state() -> HeaderState:
+    """Returns the shared header state, starting its update timer on first use."""
+    global _header_state
+    if _header_state is None:
+        _header_state = HeaderState()
+        _header_state.tick()
+        app.timer(1.0, _header_state._on_timer)
+    return _header_state
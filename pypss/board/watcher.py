@@ -0,0 +1,176 @@
+import asyncio
+import os
+import time
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from nicegui import app
+
+from ..utils.config import GLOBAL_CONFIG
+
+try:
+    from watchdog.events import FileSystemEventHandler
+    from watchdog.observers import Observer
+
+    WATCHDOG_AVAILABLE = True
+except ImportError:
+    WATCHDOG_AVAILABLE = False
+    FileSystemEventHandler = object  # type: ignore[assignment,misc]
+
+# Polling fallback: start at POLL_INTERVAL and double after IDLE_POLLS_BEFORE_BACKOFF
+# unchanged polls, up to MAX_POLL_INTERVAL. Any change resets the interval.
+POLL_INTERVAL = 1.0
+MAX_POLL_INTERVAL = 5.0
+IDLE_POLLS_BEFORE_BACKOFF = 10
+
+
+class TraceFileWatcher:
+    """
+    Notifies subscribers when a trace file changes. One watcher serves every dashboard client.
+    Uses filesystem events via watchdog when it is installed, otherwise polls the file's stat.
+    """
+
+    def __init__(self, path: str):
+        self.path = os.path.abspath(path)
+        self._subscribers: List[Callable[[], Any]] = []
+        self._signature = self._stat()
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._observer: Optional[Any] = None
+        self._poll_task: Optional[asyncio.Task] = None
+        self._last_notify = float("-inf")
+        self._first_unnotified: Optional[float] = None
+        self._pending_notify: Optional[asyncio.TimerHandle] = None
+
+    def subscribe(self, callback: Callable[[], Any]) -> Callable[[], None]:
+        """Registers a change callback and returns a function that removes it."""
+        self._subscribers.append(callback)
+
+        def unsubscribe():
+            if callback in self._subscribers:
+                self._subscribers.remove(callback)
+
+        return unsubscribe
+
+    def start(self):
+        """Starts watching. Must be called from the running event loop."""
+        self._loop = asyncio.get_running_loop()
+        directory = os.path.dirname(self.path)
+        if WATCHDOG_AVAILABLE and os.path.isdir(directory):
+            self._observer = Observer()
+            self._observer.schedule(_TraceFileEventHandler(self), directory, recursive=False)
+            self._observer.daemon = True
+            self._observer.start()
+        else:
+            self._poll_task = self._loop.create_task(self._poll_loop())
+
+    def stop(self):
+        if self._observer is not None:
+            self._observer.stop()
+            self._observer = None
+        if self._poll_task is not None:
+            self._poll_task.cancel()
+            self._poll_task = None
+        if self._pending_notify is not None:
+            self._pending_notify.cancel()
+            self._pending_notify = None
+
+    def check(self) -> bool:
+        """Stats the file once; schedules a subscriber notification and returns True if it changed."""
+        signature = self._stat()
+        if signature == self._signature:
+            return False
+        self._signature = signature
+        if signature is None:
+            return False
+        self._schedule_notify()
+        return True
+
+    def _schedule_notify(self):
+        """
+        Debounces notifications: a change after a quiet period is reported at once; changes during
+        a burst of writes are reported once the writes pause for `dashboard_refresh_debounce`
+        seconds, or at the latest `dashboard_refresh_max_delay` seconds after the first of them.
+        """
+        now = time.monotonic()
+        debounce = GLOBAL_CONFIG.dashboard_refresh_debounce
+        if self._loop is None or (self._pending_notify is None and now - self._last_notify >= debounce):
+            self._notify()
+            return
+        if self._first_unnotified is None:
+            self._first_unnotified = now
+        if self._pending_notify is not None:
+            self._pending_notify.cancel()
+        deadline = min(now + debounce, self._first_unnotified + GLOBAL_CONFIG.dashboard_refresh_max_delay)
+        self._pending_notify = self._loop.call_later(max(0.0, deadline - now), self._notify)
+
+    def _notify(self):
+        self._pending_notify = None
+        self._first_unnotified = None
+        self._last_notify = time.monotonic()
+        for callback in list(self._subscribers):
+            try:
+                callback()
+            except Exception:
+                continue
+
+    def _stat(self) -> Optional[Tuple[int, int]]:
+        try:
+            st = os.stat(self.path)
+        except OSError:
+            return None
+        return st.st_mtime_ns, st.st_size
+
+    def _on_fs_event(self):
+        # Called from the observer thread; hop onto the event loop before touching the UI
+        if self._loop is not None and not self._loop.is_closed():
+            self._loop.call_soon_threadsafe(self.check)
+
+    async def _poll_loop(self):
+        interval = POLL_INTERVAL
+        idle_polls = 0
+        while True:
+            await asyncio.sleep(interval)
+            # Nobody to notify: skip the stat and keep backing off
+            if self._subscribers and self.check():
+                interval = POLL_INTERVAL
+                idle_polls = 0
+            else:
+                idle_polls += 1
+                if idle_polls >= IDLE_POLLS_BEFORE_BACKOFF:
+                    interval = min(interval * 2, MAX_POLL_INTERVAL)
+
+
+class _TraceFileEventHandler(FileSystemEventHandler):
+    def __init__(self, watcher: TraceFileWatcher):
+        super().__init__()
+        self.watcher = watcher
+
+    def _is_trace_file(self, path) -> bool:
+        return os.path.abspath(os.fsdecode(path)) == self.watcher.path
+
+    def on_modified(self, event):
+        if self._is_trace_file(event.src_path):
+            self.watcher._on_fs_event()
+
+    def on_created(self, event):
+        # The trace file appearing after the dashboard started
+        if self._is_trace_file(event.src_path):
+            self.watcher._on_fs_event()
+
+    def on_moved(self, event):
+        # Writers that replace the file atomically (write a temp file, then rename it over the trace file)
+        if self._is_trace_file(event.dest_path):
+            self.watcher._on_fs_event()
+
+
+_watchers: Dict[str, TraceFileWatcher] = {}
+
+
+def get_trace_watcher(trace_file: str) -> TraceFileWatcher:
+    """Returns the shared watcher for a trace file, starting it once the event loop runs."""
+    path = os.path.abspath(trace_file)
+    watcher = _watchers.get(path)
+    if watcher is None:
+        watcher = _watchers[path] = TraceFileWatcher(path)
+        app.timer(0, watcher.start, once=True)
+        app.on_shutdown(watcher.stop)
+    return watcher
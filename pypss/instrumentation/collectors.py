@@ -11,6 +11,7 @@ from abc import ABC, abstractmethod
 from contextlib import contextmanager
 from types import ModuleType
 from typing import (
+    Any,
     Callable,
     Deque,
     Dict,
@@ -26,6 +27,13 @@ try:
 except ImportError:
     redis_module = None
 
+try:
+    import orjson
+
+    orjson_module: Optional[ModuleType] = orjson
+except ImportError:
+    orjson_module = None
+
 try:
     import grpc
 
@@ -341,6 +349,16 @@ class RedisCollector(ThreadedBatchCollector):
             pass
 
 
+def _decode_trace_line(line: str) -> Any:
+    """Decodes one JSON Lines record, with orjson when it is installed."""
+    if orjson_module is not None:
+        try:
+            return orjson_module.loads(line)
+        except orjson_module.JSONDecodeError:
+            pass  # e.g. NaN, which json.dumps writes but orjson rejects; the stdlib parser decides
+    return json.loads(line)
+
+
 class FileFIFOCollector(ThreadedBatchCollector):
     """
     Collector that appends traces to a file using advisory locks (flock).
@@ -381,7 +399,7 @@ class FileFIFOCollector(ThreadedBatchCollector):
                     for line in f:
                         if line.strip():
                             try:
-                                traces.append(json.loads(line))
+                                traces.append(_decode_trace_line(line))
                             except json.JSONDecodeError:
                                 continue
         except Exception:
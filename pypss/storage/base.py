@@ -1,3 +1,4 @@
+import asyncio
 from abc import ABC, abstractmethod
 from typing import Any, Dict, List, Optional
 
@@ -10,3 +11,10 @@ class StorageBackend(ABC):
     @abstractmethod
     def get_history(self, limit: int = 10, days: Optional[int] = None) -> List[Dict[str, Any]]:
         pass
+
+    async def get_history_async(self, limit: int = 10, days: Optional[int] = None) -> List[Dict[str, Any]]:
+        """
+        Awaitable variant of get_history for event-loop callers such as the dashboard.
+        Runs the blocking query in a worker thread; backends with native async I/O may override it.
+        """
+        return await asyncio.to_thread(self.get_history, limit=limit, days=days)
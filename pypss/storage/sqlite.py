@@ -113,6 +113,12 @@ class SQLiteStorage(StorageBackend):
             )
             conn.commit()
 
+    async def get_history_async(self, limit: int = 10, days: Optional[int] = None) -> List[Dict[str, Any]]:
+        if self.db_path == ":memory:":
+            # Nothing to wait on, and the shared in-memory connection is bound to its creating thread
+            return self.get_history(limit=limit, days=days)
+        return await super().get_history_async(limit=limit, days=days)
+
     def get_history(self, limit: int = 10, days: Optional[int] = None) -> List[Dict[str, Any]]:
         query = "SELECT * FROM pss_history"
         params = []
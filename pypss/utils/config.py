@@ -79,6 +79,10 @@ class PSSConfig:
 
     dashboard_critical_pss_threshold: float = 60.0
     dashboard_warning_error_rate: float = 0.05
+    # Trace-file reloads: wait until writes have paused this long (seconds)...
+    dashboard_refresh_debounce: float = 0.5
+    # ...but never hold back a change for longer than this under continuous writes
+    dashboard_refresh_max_delay: float = 5.0
 
     background_dump_interval: int = 60
     background_archive_dir: str = "archive"
@@ -3,6 +3,7 @@ import pytest
 from pypss.alerts.base import Alert, AlertSeverity
 from pypss.alerts.rules import (
     ConcurrencySpikeRule,
+    CustomRule,
     EntropyAnomalyRule,
     ErrorBurstRule,
     MemoryStabilitySpikeRule,
@@ -150,3 +151,25 @@ def test_stability_regression_rule(enabled, report_pss, history_pss_list, expect
             assert f"average {avg_pss}" in alert.message
     else:
         assert alert is None
+
+
+def test_custom_rule_module_pattern():
+    rule = CustomRule(
+        {
+            "name": "API PSS",
+            "module_pattern": r"api\.",
+            "conditions": [{"metric": "pss", "operator": "<", "value": 80}],
+        }
+    )
+    module_scores = {"api.users": {"pss": 70}, "api.orders": {"pss": 90}, "worker": {"pss": 10}}
+
+    alerts = rule.evaluate({}, module_scores=module_scores)
+    assert alerts is not None
+    assert [a.extra_data["module"] for a in alerts] == ["api.users"]
+    # The compiled pattern is kept on the rule, not written into the (saved) config
+    assert set(rule.config) == {"name", "module_pattern", "conditions"}
+
+
+def test_custom_rule_invalid_module_pattern():
+    rule = CustomRule({"module_pattern": "(", "conditions": [{"metric": "pss", "operator": "<", "value": 80}]})
+    assert rule.evaluate({}, module_scores={"api": {"pss": 10}}) is None
@@ -0,0 +1,165 @@
+import numpy as np
+import pandas as pd
+import plotly.graph_objects as go
+from nicegui import json as nicegui_json
+
+from pypss.board.charts import (
+    HEATMAP_TIME_BINS,
+    METRICS_UIREVISION,
+    TRACE_OPTS,
+    WEBGL_MIN_POINTS,
+    create_custom_chart,
+    create_gauge_chart,
+    create_historical_chart,
+    create_trend_chart,
+    distribution_sample,
+    downsample_indices,
+    figure_data,
+    gauge_chart_data,
+    historical_chart_data,
+    plot_concurrency_dist,
+    plot_entropy_heatmap,
+    plot_error_heatmap,
+    plot_stability_trends,
+)
+from pypss.board.data_loader import TraceProcessor
+
+
+def _as_json(figure):
+    return nicegui_json.dumps(figure)
+
+
+class TestFigureTemplates:
+    def test_gauge_matches_full_figure(self):
+        assert _as_json(gauge_chart_data(42, "")) == _as_json(create_gauge_chart(42, "").to_plotly_json())
+
+    def test_historical_matches_full_figure(self):
+        history = [
+            {"timestamp": 1700000000 + i * 60, "pss": 80 + i, "ts": 0.9, "ms": 0.8, "ev": 0.7, "be": 0.6, "cc": 0.5}
+            for i in range(5)
+        ]
+        assert _as_json(historical_chart_data(history)) == _as_json(create_historical_chart(history).to_plotly_json())
+        assert _as_json(historical_chart_data([])) == _as_json(create_historical_chart([]).to_plotly_json())
+
+    def test_unvalidated_traces_serialize_identically(self):
+        x, y = np.arange(100), np.random.default_rng(0).random(100)
+
+        def build(**opts):
+            fig = go.Figure()
+            fig.add_trace(go.Scatter(x=x, y=y, mode="lines", name="y", line=dict(width=2), **opts))
+            fig.update_layout(title="Trend")
+            return figure_data(fig)
+
+        assert _as_json(build(**TRACE_OPTS)) == _as_json(build())
+
+    def test_figure_data_passes_dicts_through(self):
+        data = {"data": [], "layout": {}}
+        assert figure_data(data) is data
+
+
+class TestDownsampling:
+    def test_short_series_untouched(self):
+        assert downsample_indices(np.arange(10), n_out=20).tolist() == list(range(10))
+
+    def test_keeps_extremes_and_endpoints(self):
+        y = np.zeros(10_000)
+        y[1234] = 100.0
+        y[8765] = -50.0
+        y[5000] = np.nan
+        idx = downsample_indices(y, n_out=200)
+        assert len(idx) <= 202
+        assert {0, 1234, 8765, 9999} <= set(idx.tolist())
+        assert np.all(np.diff(idx) > 0)
+
+    def test_distribution_sample(self):
+        values = np.random.default_rng(0).normal(size=50_000)
+        sample = distribution_sample(values, n_out=500)
+        assert len(sample) == 500
+        assert sample[0] == values.min() and sample[-1] == values.max()
+        assert abs(np.median(sample) - np.median(values)) < 0.05
+
+
+class TestWebGLTraces:
+    def test_long_series_use_webgl(self):
+        traces = [{"timestamp": float(i), "duration": float(i % 7)} for i in range(WEBGL_MIN_POINTS + 1)]
+        fig = create_custom_chart(traces, {"x_axis": "timestamp", "y_axis": "duration", "chart_type": "scatter"})
+        assert fig.data[0].type == "scattergl"
+
+    def test_short_series_stay_svg(self):
+        traces = [{"timestamp": float(i), "duration": float(i % 7)} for i in range(10)]
+        fig = create_custom_chart(traces, {"x_axis": "timestamp", "y_axis": "duration", "chart_type": "line"})
+        assert fig.data[0].type == "scatter"
+
+
+class TestDensityHeatmaps:
+    def test_error_heatmap_is_binned_server_side(self):
+        traces = [
+            {"timestamp": 1700000000 + i * 0.1, "module": f"mod{i % 3}", "error": i % 2 == 0} for i in range(5000)
+        ]
+        heatmap = plot_error_heatmap(traces).data[0]
+        assert heatmap.type == "heatmap"
+        assert np.asarray(heatmap.z).shape == (3, HEATMAP_TIME_BINS)
+        assert np.asarray(heatmap.z).sum() == 2500
+
+    def test_events_without_module_are_not_counted(self):
+        traces = [{"timestamp": 1700000000 + i, "module": "a", "error": True} for i in range(5)]
+        traces += [{"timestamp": 1700000000 + i, "module": "b", "error": True} for i in range(5)]
+        traces += [{"timestamp": 1700000000 + i, "module": None, "error": True} for i in range(7)]
+        heatmap = plot_error_heatmap(traces).data[0]
+        assert list(heatmap.y) == ["a", "b"]
+        assert np.asarray(heatmap.z).sum(axis=1).tolist() == [5, 5]
+
+    def test_single_timestamp(self):
+        traces = [{"timestamp": 1700000000, "module": "m", "branch_tag": "a"} for _ in range(4)]
+        heatmap = plot_entropy_heatmap(traces).data[0]
+        assert np.asarray(heatmap.z).tolist() == [[4]]
+
+
+class TestTrendPercentiles:
+    def test_matches_pandas_qcut_quantiles(self):
+        rng = np.random.default_rng(1)
+        for n in (2, 29, 30, 31, 97, 1000):
+            durations = rng.exponential(0.1, n)
+            durations[n // 2] = np.nan
+            traces = [{"timestamp": 1700000000 + i, "duration": d} for i, d in enumerate(durations)]
+            df = pd.DataFrame(traces)
+            bins = pd.qcut(df.index, q=min(30, n), duplicates="drop")
+            expected = df.groupby(bins, observed=False)["duration"].quantile([0.50, 0.90, 0.99]).unstack()
+
+            fig = create_trend_chart(traces)
+            for trace, q in zip(fig.data, (0.99, 0.90, 0.50), strict=True):
+                np.testing.assert_allclose(np.asarray(trace.y, dtype=float), expected[q].to_numpy(), rtol=1e-12)
+
+
+class TestUIRevision:
+    def test_metrics_figure_keeps_ui_state_across_windows(self):
+        traces = [{"timestamp": 1700000000 + i, "duration": 0.01 * (i % 5 + 1), "module": "m"} for i in range(600)]
+        processor = TraceProcessor(traces)
+        figures = [plot_stability_trends(processor.get_metric_timeseries(w)) for w in ("1min", "5min")]
+        assert all(fig.layout.uirevision == METRICS_UIREVISION for fig in figures)
+
+
+class TestSharedFrame:
+    def test_builders_accept_processor_frame_without_modifying_it(self):
+        traces = [
+            {
+                "timestamp": 1700000000 + i,
+                "duration": 0.01 * (i % 5 + 1),
+                "module": f"mod{i % 3}",
+                "error": i % 4 == 0,
+                "branch_tag": "a" if i % 2 else "",
+                "cpu_time": 0.001 * i,
+                "wait_time": 0.002 * i,
+            }
+            for i in range(60)
+        ]
+        frame = TraceProcessor(traces).frame
+        snapshot = frame.copy()
+        config = {"x_axis": "timestamp", "y_axis": "duration", "chart_type": "line"}
+
+        for build in (create_trend_chart, plot_error_heatmap, plot_entropy_heatmap, plot_concurrency_dist):
+            assert _as_json(build(frame).to_plotly_json()) == _as_json(build(traces).to_plotly_json())
+        assert _as_json(create_custom_chart(frame, config).to_plotly_json()) == _as_json(
+            create_custom_chart(traces, config).to_plotly_json()
+        )
+        assert frame.equals(snapshot)
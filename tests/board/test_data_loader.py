@@ -1,9 +1,26 @@
+import json
+import os
+from datetime import datetime
 from unittest.mock import patch
 
+import numpy as np
 import pandas as pd
 import pytest
 
-from pypss.board.data_loader import TraceProcessor, load_trace_data
+from pypss.board.data_loader import (
+    ERROR_PREVIEW_LENGTH,
+    FAILED_ROW_FORMATTERS,
+    TraceProcessor,
+    clear_trace_cache,
+    compute_kpis,
+    compute_pss_cached,
+    format_clock_times,
+    format_durations_ms,
+    load_trace_data,
+    table_page,
+    trace_fingerprint,
+)
+from pypss.utils.config import GLOBAL_CONFIG
 
 
 class TestTraceProcessor:
@@ -51,6 +68,9 @@ class TestTraceProcessor:
         assert not processor.df.empty
         assert isinstance(processor.df.index, pd.DatetimeIndex)
         assert len(processor.df) == 3
+        # The shared frame keeps the trace columns and file order
+        assert "datetime" not in processor.frame.columns
+        assert processor.frame["timestamp"].tolist() == [t["timestamp"] for t in sample_traces]
 
     def test_init_empty_traces(self):
         processor = TraceProcessor([])
@@ -85,6 +105,32 @@ class TestTraceProcessor:
         assert row2["ms"] > 0.99  # Tiny memory diff
         assert row2["ev"] == 1.0
 
+    def test_get_metric_timeseries_is_memoized_per_window_and_config(self, sample_traces):
+        processor = TraceProcessor(sample_traces)
+
+        first = processor.get_metric_timeseries("1min")
+        assert processor.get_metric_timeseries("1min") is first
+        assert processor.get_metric_timeseries("30s") is not first
+
+        with patch("pypss.board.data_loader.GLOBAL_CONFIG.w_ts", 0.9):
+            assert processor.get_metric_timeseries("1min") is not first
+
+    def test_branch_entropy_and_empty_windows(self):
+        traces = [
+            {"timestamp": 1600000000.0, "duration": 0.1, "branch_tag": "a"},
+            {"timestamp": 1600000001.0, "duration": 0.1, "branch_tag": "b"},
+            {"timestamp": 1600000002.0, "duration": 0.1, "branch_tag": None},
+            {"timestamp": 1600000125.0, "duration": 0.1, "branch_tag": "a"},
+        ]
+        df_ts = TraceProcessor(traces).get_metric_timeseries("1min")
+
+        assert len(df_ts) == 3
+        # Two equally likely tags: 1 bit of entropy
+        assert df_ts["be"].iloc[0] == pytest.approx(max(0.0, 1.0 - 1.0 / GLOBAL_CONFIG.advisor_entropy_threshold))
+        # The minute without traces scores 1.0 across the board
+        assert df_ts.iloc[1][["ts", "be"]].tolist() == [1.0, 1.0]
+        assert df_ts["be"].iloc[2] == 1.0
+
     def test_get_metric_timeseries_empty(self):
         processor = TraceProcessor([])
         df = processor.get_metric_timeseries()
@@ -159,12 +205,11 @@ class TestTraceProcessor:
 
 
 class TestLoadTraceData:
-    @patch("builtins.open")
-    @patch("json.load")
     @patch("pypss.board.data_loader.compute_pss_from_traces")
     @patch("pypss.board.data_loader.get_module_score_breakdown")
-    def test_load_trace_data_success(self, mock_get_mods, mock_compute, mock_json, mock_open):
-        mock_json.return_value = {"traces": [{"timestamp": 1, "name": "t1"}]}
+    def test_load_trace_data_success(self, mock_get_mods, mock_compute, tmp_path):
+        trace_file = tmp_path / "traces.json"
+        trace_file.write_text(json.dumps({"traces": [{"timestamp": 1, "name": "t1"}]}))
         mock_compute.return_value = {"pss": 80}
         mock_get_mods.return_value = {
             "mod1": {
@@ -177,7 +222,7 @@ class TestLoadTraceData:
             }
         }
 
-        report, mod_df, traces, processor = load_trace_data("fake.json")
+        report, mod_df, traces, processor = load_trace_data(str(trace_file))
 
         assert report["pss"] == 80
         assert not mod_df.empty
@@ -185,30 +230,48 @@ class TestLoadTraceData:
         assert isinstance(processor, TraceProcessor)
         assert len(processor.traces) == 1
 
+    def test_module_trace_counts_match_names(self, tmp_path):
+        traces = [
+            {"timestamp": 1.0, "duration": 0.1, "module": "app.db", "name": "app.db.query"},
+            {"timestamp": 2.0, "duration": 0.1, "module": "app.db", "name": "app.db.query"},
+            {"timestamp": 3.0, "duration": 0.1, "module": "app.api", "name": "app.api.get"},
+            {"timestamp": 4.0, "duration": 0.1, "module": "app.api"},
+        ]
+        trace_file = tmp_path / "traces.json"
+        trace_file.write_text(json.dumps({"traces": traces}))
+
+        _, mod_df, _, _ = load_trace_data(str(trace_file))
+        assert dict(zip(mod_df["module"], mod_df["traces"], strict=True)) == {"app.db": 2, "app.api": 1}
+
     @patch("builtins.open")
     def test_load_trace_data_file_error(self, mock_open):
         mock_open.side_effect = FileNotFoundError
         res = load_trace_data("missing.json")
         assert res == (None, None, None, None)
 
-    @patch("builtins.open")
-    @patch("json.load")
-    def test_load_trace_data_json_error(self, mock_json, mock_open):
-        mock_json.side_effect = ValueError("Invalid JSON")
-        res = load_trace_data("corrupt.json")
+    def test_load_trace_data_json_error(self, tmp_path):
+        trace_file = tmp_path / "corrupt.json"
+        trace_file.write_text('{"traces": [')
+        res = load_trace_data(str(trace_file))
         assert res == (None, None, None, None)
 
-    @patch("builtins.open")
-    @patch("json.load")
-    def test_load_trace_data_empty_or_bad_format(self, mock_json, mock_open):
+    def test_load_trace_data_accepts_nan(self, tmp_path):
+        trace_file = tmp_path / "traces.json"
+        trace_file.write_text('{"traces": [{"timestamp": 1, "name": "t1", "duration": NaN}]}')
+        _, _, traces, _ = load_trace_data(str(trace_file))
+        assert len(traces) == 1
+
+    def test_load_trace_data_empty_or_bad_format(self, tmp_path):
         # Test empty data
-        mock_json.return_value = {}
-        res = load_trace_data("empty.json")
+        trace_file = tmp_path / "empty.json"
+        trace_file.write_text("{}")
+        res = load_trace_data(str(trace_file))
         assert res == (None, None, None, None)
 
         # Test unknown dict format (not "traces" key)
-        mock_json.return_value = {"other_key": "value"}
-        res = load_trace_data("unknown_dict.json")
+        trace_file = tmp_path / "unknown_dict.json"
+        trace_file.write_text('{"other_key": "value"}')
+        res = load_trace_data(str(trace_file))
         # Should return default empty structure now, not None tuple
         assert res[0]["pss"] == 0
         assert res[1].empty
@@ -216,9 +279,282 @@ class TestLoadTraceData:
         assert res[3] is not None
 
         # Test empty list (should also return None, None, None, None due to 'if not data' check)
-        mock_json.return_value = []
-        report, mod_df, traces, processor = load_trace_data("empty_list.json")
+        trace_file = tmp_path / "empty_list.json"
+        trace_file.write_text("[]")
+        report, mod_df, traces, processor = load_trace_data(str(trace_file))
         assert report is None
         assert mod_df is None
         assert traces is None
         assert processor is None
+
+
+class TestTraceCaching:
+    @pytest.fixture(autouse=True)
+    def _clear_cache(self):
+        clear_trace_cache()
+        yield
+        clear_trace_cache()
+
+    def _write(self, path, traces):
+        path.write_text(json.dumps({"traces": traces}))
+
+    def _append_lines(self, path, traces, tail=""):
+        with open(path, "a") as f:
+            f.write("".join(json.dumps(t) + "\n" for t in traces) + tail)
+
+    def test_load_is_cached_until_file_changes(self, tmp_path):
+        trace_file = tmp_path / "traces.json"
+        self._write(trace_file, [{"timestamp": 1.0, "duration": 0.1, "name": "f", "module": "m"}])
+
+        first = load_trace_data(str(trace_file))
+        second = load_trace_data(str(trace_file))
+        assert first[2] is second[2]
+
+        self._write(trace_file, [{"timestamp": 2.0, "duration": 0.2, "name": "g", "module": "m"}] * 2)
+        os.utime(trace_file, ns=(0, os.stat(trace_file).st_mtime_ns + 1_000_000))
+
+        third = load_trace_data(str(trace_file))
+        assert third[2] is not first[2]
+        assert len(third[2]) == 2
+
+    def test_json_lines_are_read_incrementally(self, tmp_path):
+        trace_file = tmp_path / "traces.jsonl"
+        self._append_lines(trace_file, [{"timestamp": 1.0, "name": "f", "module": "m"}] * 2, tail='{"timestamp": 2.0, ')
+        first = load_trace_data(str(trace_file))
+        assert len(first[2]) == 2  # the partial line is left for the next read
+
+        with open(trace_file, "a") as f:
+            f.write('"name": "g", "module": "m"}\n')
+        self._append_lines(trace_file, [{"timestamp": 3.0, "name": "h", "module": "m"}])
+        second = load_trace_data(str(trace_file))
+        assert [t["timestamp"] for t in second[2]] == [1.0, 1.0, 2.0, 3.0]
+
+        self._append_lines(trace_file, [{"timestamp": 4.0, "name": "i", "module": "m"}])
+        third = load_trace_data(str(trace_file))
+        assert [t["timestamp"] for t in third[2]] == [1.0, 1.0, 2.0, 3.0, 4.0]
+        assert third[2][0] is second[2][0]  # earlier lines were not parsed again
+        assert len(second[2]) == 4  # earlier loads are left untouched
+
+    def test_single_line_json_lines_file(self, tmp_path):
+        trace_file = tmp_path / "traces.jsonl"
+        self._append_lines(trace_file, [{"timestamp": 1.0, "duration": 0.1, "name": "f", "module": "m"}])
+        report, _, traces, _ = load_trace_data(str(trace_file))
+        assert [t["name"] for t in traces] == ["f"]
+        assert report["pss"] > 0
+
+        self._append_lines(trace_file, [{"timestamp": 2.0, "duration": 0.1, "name": "g", "module": "m"}])
+        assert [t["name"] for t in load_trace_data(str(trace_file))[2]] == ["f", "g"]
+
+    def test_rewritten_json_lines_file_is_reread(self, tmp_path):
+        trace_file = tmp_path / "traces.jsonl"
+        self._append_lines(trace_file, [{"timestamp": 1.0, "name": "f", "module": "m"}] * 3)
+        assert len(load_trace_data(str(trace_file))[2]) == 3
+
+        self._write(trace_file, [{"timestamp": 9.0, "name": "g", "module": "m"}] * 5)
+        assert [t["timestamp"] for t in load_trace_data(str(trace_file))[2]] == [9.0] * 5
+
+    def test_load_is_rescored_when_scoring_settings_change(self, tmp_path):
+        trace_file = tmp_path / "traces.json"
+        self._write(trace_file, [{"timestamp": float(i), "duration": 0.1 * (i % 4), "name": "f"} for i in range(20)])
+
+        first = load_trace_data(str(trace_file))
+        with patch.object(GLOBAL_CONFIG, "w_ts", GLOBAL_CONFIG.w_ts + 1.0):
+            rescored = load_trace_data(str(trace_file))
+        assert rescored[0] is not first[0]
+        assert rescored[0]["pss"] != first[0]["pss"]
+        assert load_trace_data(str(trace_file))[0] is first[0]
+
+    def test_trace_fingerprint(self):
+        assert trace_fingerprint([]) == (0,)
+        traces = [{"timestamp": 1.0, "name": "a"}, {"timestamp": 2.0, "name": "b"}]
+        assert trace_fingerprint(traces) == (2, 1.0, "a", 2.0, "b")
+        assert trace_fingerprint(list(traces)) == trace_fingerprint(traces)
+
+    @patch("pypss.board.data_loader.compute_pss_from_traces")
+    def test_compute_pss_cached(self, mock_compute):
+        mock_compute.return_value = {"pss": 90}
+        traces = [{"timestamp": 1.0, "name": "a"}]
+
+        assert compute_pss_cached(traces) == {"pss": 90}
+        assert compute_pss_cached(list(traces)) == {"pss": 90}
+        assert mock_compute.call_count == 1
+
+        compute_pss_cached([{"timestamp": 5.0, "name": "b"}])
+        assert mock_compute.call_count == 2
+
+        with patch.object(GLOBAL_CONFIG, "alpha", GLOBAL_CONFIG.alpha + 1.0):
+            compute_pss_cached(traces)
+        assert mock_compute.call_count == 3
+
+        # Same length and first/last traces, different traces in between
+        ends = [{"timestamp": 1.0, "name": "a"}, {"timestamp": 3.0, "name": "a"}]
+        compute_pss_cached([ends[0], {"timestamp": 2.0, "name": "a", "duration": 0.1}, ends[1]])
+        compute_pss_cached([ends[0], {"timestamp": 2.0, "name": "a", "duration": 0.9}, ends[1]])
+        assert mock_compute.call_count == 5
+
+    @patch("pypss.board.data_loader.compute_pss_from_traces")
+    def test_module_report_is_computed_once_per_processor(self, mock_compute):
+        mock_compute.side_effect = lambda traces: {"pss": len(traces)}
+        traces = [{"timestamp": float(i), "name": "f", "module": "a" if i % 3 else "b"} for i in range(9)]
+        processor = TraceProcessor(traces)
+
+        assert processor.get_module_report("a") == {"pss": 6}
+        assert processor.get_module_report("b") == {"pss": 3}
+        assert processor.get_module_report("a") is processor.get_module_report("a")
+        assert mock_compute.call_count == 2
+
+
+class TestFormatting:
+    def test_format_clock_times_matches_local_time(self):
+        timestamps = [0.0, 1600000000.0, 1700000123.9]
+        expected = [datetime.fromtimestamp(ts).strftime("%H:%M:%S") for ts in timestamps]
+        assert format_clock_times(timestamps) == expected
+
+        # A year of timestamps crosses any local DST transitions
+        timestamps = np.linspace(1700000000.0, 1700000000.0 + 366 * 86400, 5000)
+        expected = [datetime.fromtimestamp(ts).strftime("%H:%M:%S") for ts in timestamps]
+        assert format_clock_times(timestamps) == expected
+
+    def test_format_durations_ms(self):
+        assert format_durations_ms([0.0123, 1.5, 0]) == ["12.3ms", "1500.0ms", "0.0ms"]
+
+    def test_empty_inputs(self):
+        assert format_clock_times([]) == []
+        assert format_durations_ms([]) == []
+
+
+class TestTablePage:
+    df = pd.DataFrame({"module": ["a", "b", "c", "d"], "pss": [90, 40, 70, 60], "errors": [0.1, 0.5, 0.25, 0.0]})
+
+    def test_first_page_unsorted(self):
+        rows = table_page(self.df, {"page": 1, "rowsPerPage": 2, "sortBy": None})
+        assert [r["module"] for r in rows] == ["a", "b"]
+
+    def test_sorts_on_raw_values_and_formats_page(self):
+        rows = table_page(self.df, {"page": 2, "rowsPerPage": 2, "sortBy": "errors", "descending": True}, ("errors",))
+        assert rows == [
+            {"module": "a", "pss": 90, "errors": "0.10"},
+            {"module": "d", "pss": 60, "errors": "0.00"},
+        ]
+
+    def test_zero_rows_per_page_returns_all(self):
+        assert len(table_page(self.df, {"page": 1, "rowsPerPage": 0, "sortBy": "pss"})) == 4
+
+    def test_records_match_to_dict_with_native_types(self):
+        rows = table_page(self.df, {"page": 1, "rowsPerPage": 0, "sortBy": None})
+        assert rows == self.df.to_dict("records")
+        assert type(rows[0]["pss"]) is int and type(rows[0]["errors"]) is float
+        assert table_page(self.df.iloc[:0], {"page": 1, "rowsPerPage": 10, "sortBy": None}) == []
+
+    def test_failed_traces_sort_on_raw_duration(self):
+        traces = [
+            {"timestamp": 1.0, "duration": d, "module": "m", "name": f"f{i}", "error": True}
+            for i, d in enumerate([0.0123, 1.5, 0.2])
+        ]
+        failed = TraceProcessor(traces).get_failed_frame("m")
+        page = {"page": 1, "rowsPerPage": 2, "sortBy": "duration", "descending": True}
+        rows = table_page(failed, page, formatters=FAILED_ROW_FORMATTERS)
+        assert [(r["function"], r["duration"]) for r in rows] == [("f1", "1500.0ms"), ("f2", "200.0ms")]
+        assert failed["duration"].tolist() == [0.0123, 1.5, 0.2]
+
+
+def _failed_rows(processor, module=None):
+    """Every failed-trace row as the tables show them, on a single page."""
+    return table_page(processor.get_failed_frame(module), {"rowsPerPage": 0}, formatters=FAILED_ROW_FORMATTERS)
+
+
+class TestKpis:
+    def test_compute_kpis(self):
+        durations = np.arange(1, 21, dtype=np.float64) / 10
+        errors = np.zeros(20, dtype=bool)
+        errors[[0, 5, 6]] = True
+
+        kpis = compute_kpis(durations, errors)
+        assert kpis["total"] == 20
+        assert kpis["duration_mean"] == pytest.approx(1.05)
+        assert kpis["error_count"] == 3
+        assert kpis["error_rate"] == pytest.approx(0.15)
+
+    def test_compute_kpis_empty(self):
+        empty = np.array([], dtype=np.float64)
+        kpis = compute_kpis(empty, empty.astype(bool))
+        assert kpis["total"] == 0
+        assert kpis["error_rate"] == 0.0
+
+    def test_processor_kpis_handle_missing_values(self):
+        traces = [
+            {"timestamp": 1.0, "duration": 0.1, "module": "a", "error": True},
+            {"timestamp": 2.0, "duration": 0.3, "module": "b", "error": None},
+            {"timestamp": 3.0, "module": "a"},
+        ]
+        kpis = TraceProcessor(traces).get_kpis()
+        assert kpis["total"] == 3
+        assert kpis["duration_mean"] == pytest.approx(0.4 / 3)
+        assert kpis["error_count"] == 1
+
+        assert TraceProcessor([]).get_kpis()["total"] == 0
+
+    def test_get_failed_rows(self):
+        traces = [
+            {"timestamp": 1.0, "duration": 0.01, "module": "a", "name": "f", "error": True, "exception_type": "E"},
+            {"timestamp": 2.0, "duration": 0.02, "module": "b", "name": "g", "error": True},
+            {"timestamp": 3.0, "duration": 0.03, "module": "a", "name": "h", "error": False},
+        ]
+        processor = TraceProcessor(traces)
+
+        rows = _failed_rows(processor)
+        assert [r["function"] for r in rows] == ["f", "g"]
+        assert rows[0]["error_type"] == "E"
+        assert rows[1]["error_type"] == "N/A"
+        assert rows[1]["duration"] == "20.0ms"
+        assert rows[0]["time"] == datetime.fromtimestamp(1.0).strftime("%H:%M:%S")
+
+        assert [r["index"] for r in rows] == [0, 1]
+        assert all(type(r["index"]) is int for r in rows)
+
+        assert [r["function"] for r in _failed_rows(processor, "a")] == ["f"]
+        assert _failed_rows(processor, "missing") == []
+        assert _failed_rows(TraceProcessor([])) == []
+
+    def test_failed_rows_truncate_long_messages(self):
+        long_message = "Traceback:\n" + "x" * 500
+        traces = [
+            {"timestamp": 1.0, "error": True, "exception_message": long_message},
+            {"timestamp": 2.0, "error": True, "exception_message": "short"},
+        ]
+        processor = TraceProcessor(traces)
+        rows = _failed_rows(processor)
+
+        assert len(rows[0]["error_message"]) == ERROR_PREVIEW_LENGTH
+        assert rows[0]["error_message"].endswith("…")
+        assert rows[1]["error_message"] == "short"
+        assert processor.columns.exception_message[rows[0]["index"]] == long_message
+
+
+class TestTraceColumns:
+    def test_columns_follow_file_order_with_defaults(self):
+        traces = [
+            {"timestamp": 5.0, "duration": 0.2, "module": "b", "error": True},
+            {"timestamp": 1.0, "name": "f", "module": "a"},
+            {"timestamp": 3.0, "duration": 0.1, "module": "b", "error": None},
+        ]
+        processor = TraceProcessor(traces)
+        cols = processor.columns
+
+        assert len(cols) == 3
+        assert cols.timestamp.tolist() == [5.0, 1.0, 3.0]
+        assert cols.duration.tolist() == [0.2, 0.0, 0.1]
+        assert cols.error.tolist() == [True, False, False]
+        assert cols.name.tolist() == ["unknown", "f", "unknown"]
+        assert cols.exception_type.tolist() == ["N/A"] * 3
+        assert processor.get_module_traces("b") == [traces[0], traces[2]]
+        assert processor.get_module_traces("missing") == []
+        assert processor.get_module_frame("b")["timestamp"].tolist() == [5.0, 3.0]
+        assert processor.get_module_frame("missing").empty
+        assert {m: idx.tolist() for m, idx in cols.module_groups.items()} == {"b": [0, 2], "a": [1]}
+
+    def test_empty_columns(self):
+        processor = TraceProcessor([])
+        assert len(processor.columns) == 0
+        assert processor.columns.module_groups == {}
+        assert processor.get_module_traces("a") == []
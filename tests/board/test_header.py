@@ -0,0 +1,56 @@
+import os
+from datetime import datetime
+
+from pypss.board.header import HeaderState, TraceFileState
+
+
+class TestHeaderState:
+    def test_freshness_formatting(self, tmp_path):
+        trace_file = tmp_path / "traces.json"
+        trace_file.write_text("[]")
+        mtime = os.path.getmtime(trace_file)
+        state = TraceFileState(str(trace_file))
+
+        state.update(mtime + 5)
+        assert state.freshness == "Data: 5s ago"
+        state.update(mtime + 150)
+        assert state.freshness == "Data: 2m ago"
+        state.update(mtime + 7300)
+        assert state.freshness == "Data: 2h ago"
+
+    def test_missing_file_is_pending(self, tmp_path):
+        state = TraceFileState(str(tmp_path / "missing.json"))
+        state.update(0)
+        assert state.freshness == "Data: Pending"
+
+    def test_tick_updates_clock_and_watched_files(self, tmp_path):
+        header = HeaderState()
+        watched = header.watch(str(tmp_path / "missing.json"))
+        assert header.watch(str(tmp_path / "missing.json")) is watched
+
+        header.tick()
+        assert header.clock
+        assert watched.freshness == "Data: Pending"
+
+    def test_clock_uses_local_time(self):
+        header = HeaderState()
+        header.tick()
+        assert header.clock.startswith(datetime.now().strftime("%Y-%m-%d %H:"))
+
+    def test_timer_is_idle_without_attached_pages(self, tmp_path):
+        header = HeaderState()
+        header._on_timer()
+        assert header.clock == ""
+
+        detach = header.attach()
+        first = header.clock
+        assert first
+        header.clock = "stale"
+        header._on_timer()
+        assert header.clock != "stale"
+
+        detach()
+        detach()  # idempotent
+        header.clock = "stale"
+        header._on_timer()
+        assert header.clock == "stale"
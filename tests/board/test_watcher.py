@@ -0,0 +1,185 @@
+import asyncio
+import os
+from unittest.mock import patch
+
+import pytest
+
+from pypss.board import watcher as watcher_module
+from pypss.board.watcher import TraceFileWatcher
+from pypss.utils.config import GLOBAL_CONFIG
+
+
+def _bump_mtime(path, seconds=10):
+    st = os.stat(path)
+    os.utime(path, ns=(st.st_atime_ns, st.st_mtime_ns + seconds * 1_000_000_000))
+
+
+class TestTraceFileWatcher:
+    def test_check_notifies_only_on_change(self, tmp_path):
+        trace_file = tmp_path / "traces.json"
+        trace_file.write_text("[]")
+        watcher = TraceFileWatcher(str(trace_file))
+        calls = []
+        unsubscribe = watcher.subscribe(lambda: calls.append(1))
+
+        assert watcher.check() is False
+        _bump_mtime(trace_file)
+        assert watcher.check() is True
+        assert calls == [1]
+
+        unsubscribe()
+        _bump_mtime(trace_file)
+        assert watcher.check() is True
+        assert calls == [1]
+
+    def test_detects_sub_second_rewrites(self, tmp_path):
+        trace_file = tmp_path / "traces.json"
+        trace_file.write_text("[1]")
+        watcher = TraceFileWatcher(str(trace_file))
+
+        # Same size, mtime only 1ms later: a float-seconds comparison can miss this
+        st = os.stat(trace_file)
+        trace_file.write_text("[2]")
+        os.utime(trace_file, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000))
+        assert watcher.check() is True
+
+    def test_missing_file_does_not_notify_until_created(self, tmp_path):
+        trace_file = tmp_path / "traces.json"
+        watcher = TraceFileWatcher(str(trace_file))
+        calls = []
+        watcher.subscribe(lambda: calls.append(1))
+
+        assert watcher.check() is False
+        trace_file.write_text("[]")
+        assert watcher.check() is True
+        assert calls == [1]
+
+    def test_failing_subscriber_does_not_block_others(self, tmp_path):
+        trace_file = tmp_path / "traces.json"
+        trace_file.write_text("[]")
+        watcher = TraceFileWatcher(str(trace_file))
+        calls = []
+        watcher.subscribe(lambda: 1 / 0)
+        watcher.subscribe(lambda: calls.append(1))
+
+        _bump_mtime(trace_file)
+        watcher.check()
+        assert calls == [1]
+
+    @pytest.mark.asyncio
+    async def test_bursts_are_coalesced(self, tmp_path):
+        trace_file = tmp_path / "traces.json"
+        trace_file.write_text("[]")
+        watcher = TraceFileWatcher(str(trace_file))
+        watcher._loop = asyncio.get_running_loop()
+        calls = []
+        watcher.subscribe(lambda: calls.append(1))
+
+        with (
+            patch.object(GLOBAL_CONFIG, "dashboard_refresh_debounce", 0.1),
+            patch.object(GLOBAL_CONFIG, "dashboard_refresh_max_delay", 10.0),
+        ):
+            for _ in range(5):
+                _bump_mtime(trace_file)
+                assert watcher.check() is True
+            # Leading edge fires immediately, the rest of the burst collapses into one trailing call
+            assert calls == [1]
+            await asyncio.sleep(0.2)
+            assert calls == [1, 1]
+
+    @pytest.mark.asyncio
+    async def test_continuous_writes_are_reported_after_max_delay(self, tmp_path):
+        trace_file = tmp_path / "traces.json"
+        trace_file.write_text("[]")
+        watcher = TraceFileWatcher(str(trace_file))
+        watcher._loop = asyncio.get_running_loop()
+        calls = []
+        watcher.subscribe(lambda: calls.append(1))
+
+        with (
+            patch.object(GLOBAL_CONFIG, "dashboard_refresh_debounce", 0.2),
+            patch.object(GLOBAL_CONFIG, "dashboard_refresh_max_delay", 0.3),
+        ):
+            # Writes never pause for the debounce period, yet changes still surface
+            for _ in range(16):
+                _bump_mtime(trace_file)
+                watcher.check()
+                await asyncio.sleep(0.05)
+            assert 2 <= len(calls) <= 4
+            watcher.stop()
+
+    @pytest.mark.asyncio
+    async def test_polling_fallback(self, tmp_path):
+        trace_file = tmp_path / "traces.json"
+        trace_file.write_text("[]")
+        changed = asyncio.Event()
+
+        with (
+            patch.object(watcher_module, "WATCHDOG_AVAILABLE", False),
+            patch.object(watcher_module, "POLL_INTERVAL", 0.01),
+        ):
+            watcher = TraceFileWatcher(str(trace_file))
+            watcher.subscribe(changed.set)
+            watcher.start()
+            try:
+                _bump_mtime(trace_file)
+                await asyncio.wait_for(changed.wait(), timeout=2)
+            finally:
+                watcher.stop()
+
+    @pytest.mark.asyncio
+    async def test_polling_skips_stat_without_subscribers(self, tmp_path):
+        trace_file = tmp_path / "traces.json"
+        trace_file.write_text("[]")
+
+        with (
+            patch.object(watcher_module, "WATCHDOG_AVAILABLE", False),
+            patch.object(watcher_module, "POLL_INTERVAL", 0.01),
+        ):
+            watcher = TraceFileWatcher(str(trace_file))
+            with patch.object(watcher, "check", wraps=watcher.check) as check:
+                watcher.start()
+                try:
+                    await asyncio.sleep(0.1)
+                    assert check.call_count == 0
+                    watcher.subscribe(lambda: None)
+                    await asyncio.sleep(0.1)
+                    assert check.call_count > 0
+                finally:
+                    watcher.stop()
+
+    @pytest.mark.asyncio
+    @pytest.mark.skipif(not watcher_module.WATCHDOG_AVAILABLE, reason="watchdog not installed")
+    async def test_filesystem_events(self, tmp_path):
+        trace_file = tmp_path / "traces.json"
+        trace_file.write_text("[]")
+        changed = asyncio.Event()
+
+        watcher = TraceFileWatcher(str(trace_file))
+        watcher.subscribe(changed.set)
+        watcher.start()
+        try:
+            await asyncio.sleep(0.1)
+            trace_file.write_text('[{"name": "x"}]')
+            await asyncio.wait_for(changed.wait(), timeout=5)
+        finally:
+            watcher.stop()
+
+    @pytest.mark.asyncio
+    @pytest.mark.skipif(not watcher_module.WATCHDOG_AVAILABLE, reason="watchdog not installed")
+    async def test_filesystem_events_for_atomic_replace(self, tmp_path):
+        trace_file = tmp_path / "traces.json"
+        trace_file.write_text("[]")
+        changed = asyncio.Event()
+
+        watcher = TraceFileWatcher(str(trace_file))
+        watcher.subscribe(changed.set)
+        watcher.start()
+        try:
+            await asyncio.sleep(0.1)
+            temp_file = tmp_path / "traces.json.tmp"
+            temp_file.write_text('[{"name": "x"}, {"name": "y"}]')
+            os.replace(temp_file, trace_file)
+            await asyncio.wait_for(changed.wait(), timeout=5)
+        finally:
+            watcher.stop()
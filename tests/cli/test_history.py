@@ -358,7 +358,7 @@ def test_diagnose_command_trace_file_read_error(runner, tmp_path):
 
 def test_board_command_missing_dependencies(runner, capsys):
     # Mock ImportError for nicegui
-    with patch("sys.modules", new={"nicegui": None, "plotly": None, "pandas": None}):
+    with patch.dict("sys.modules", {"nicegui": None, "plotly": None, "pandas": None}):
         result = runner.invoke(main, ["board", "dummy_traces.json"])
         assert result.exit_code == 1
         assert "Dashboard dependencies missing." in result.output
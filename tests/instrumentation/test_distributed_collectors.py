@@ -1,4 +1,5 @@
 import json
+import math
 import os  # Added import os
 import queue
 import time
@@ -90,6 +91,16 @@ class TestFileFIFOCollector:
         assert len(collector.get_traces()) == 0
         collector.shutdown()
 
+    def test_get_traces_reads_nan_and_skips_bad_lines(self, tmp_path):
+        f = tmp_path / "traces_nan.jsonl"
+        f.write_text('{"name": "t1", "duration": NaN}\nnot json\n{"name": "t2", "duration": 0.5}\n')
+        collector = FileFIFOCollector(str(f))
+
+        traces = collector.get_traces()
+        assert [t["name"] for t in traces] == ["t1", "t2"]
+        assert math.isnan(traces[0]["duration"])
+        collector.shutdown()
+
     def test_flush_on_interval(self, tmp_path):
         f = tmp_path / "traces_interval.jsonl"
         # Large batch, short interval
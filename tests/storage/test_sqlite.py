@@ -1,3 +1,5 @@
+import pytest
+
 from pypss.storage.sqlite import SQLiteStorage
 
 
@@ -31,3 +33,21 @@ def test_sqlite_storage_save_and_get(tmp_path):
     history = storage.get_history(limit=5)
     assert len(history) == 2
     assert history[0]["pss"] == 90.0  # Latest first
+
+
+@pytest.mark.asyncio
+async def test_sqlite_get_history_async(tmp_path):
+    storage = SQLiteStorage(db_path=str(tmp_path / "test.db"))
+    storage.save({"pss": 70.0, "breakdown": {}})
+
+    history = await storage.get_history_async(limit=5)
+    assert [h["pss"] for h in history] == [70.0]
+
+
+@pytest.mark.asyncio
+async def test_sqlite_get_history_async_in_memory():
+    storage = SQLiteStorage(db_path=":memory:")
+    storage.save({"pss": 60.0, "breakdown": {}})
+
+    history = await storage.get_history_async()
+    assert [h["pss"] for h in history] == [60.0]